@@ -5,16 +5,25 @@ This integration provides support for Nuki Smart Lock with Keypad,
 including lock control, keypad event detection, and automation triggers.
 """
 import logging
+from datetime import timedelta
+
+import aiohttp
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_API_KEY
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.const import CONF_API_KEY, CONF_SCAN_INTERVAL, EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, ServiceCall
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.json import json_dumps
+from homeassistant.util.ssl import get_default_context
 
-from .const import DOMAIN, PLATFORMS
+from .const import DOMAIN, PLATFORMS, DEFAULT_SCAN_INTERVAL, API_MAX_CONCURRENCY
+from .coordinator import NukiCoordinator, smartlocks_by_id
+from .lock import NukiAPI
 
 _LOGGER = logging.getLogger(__name__)
 
+SERVICE_DEBUG_LAST_ACCESS = "debug_last_access"
+
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the Nuki integration."""
@@ -28,32 +37,56 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Nuki from a config entry."""
-    from .lock import NukiAPI
-    from homeassistant.helpers.aiohttp_client import async_get_clientsession
-    
     hass.data.setdefault(DOMAIN, {})
     
-    # Create API client
-    session = async_get_clientsession(hass)
-    api = NukiAPI(session, entry.data[CONF_API_KEY])
+    # Create API client with a connection pool tuned for the single Nuki host
+    connector = aiohttp.TCPConnector(
+        # Matches the API client's request semaphore, so no request waits for a socket
+        limit_per_host=API_MAX_CONCURRENCY,
+        keepalive_timeout=75,
+        ttl_dns_cache=300,
+        ssl=get_default_context(),
+    )
+    # Serialize request bodies with orjson, as Home Assistant's shared sessions do
+    session = aiohttp.ClientSession(connector=connector, json_serialize=json_dumps)
+    api = NukiAPI(session, entry.data[CONF_API_KEY], owns_session=True)
     
-    # Test connection
+    # Fetching the smartlocks doubles as the connection test: it raises on auth or network errors
     try:
-        if not await api.test_connection():
-            raise ConfigEntryNotReady("Failed to connect to Nuki API")
-        
         smartlocks = await api.get_smartlocks()
         if not smartlocks:
             raise ConfigEntryNotReady("No smart locks found")
             
     except Exception as ex:
         _LOGGER.error("Error connecting to Nuki API: %s", ex)
+        await api.close()
         raise ConfigEntryNotReady(f"Error connecting to Nuki API: {ex}") from ex
     
+    # Entries aren't unloaded on shutdown, so close the session when Home Assistant stops
+    async def _async_close_session(event: Event) -> None:
+        """Close the API session on shutdown."""
+        await api.close()
+    
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
+    )
+    
+    # Summarize which optional hardware each smartlock reports, once for all platforms
+    capabilities = {
+        smartlock["smartlockId"]: _get_capabilities(smartlock) for smartlock in smartlocks
+    }
+    
+    # Create one shared coordinator for all smartlocks, seeded with the data we just fetched
+    scan_interval = timedelta(seconds=entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL))
+    coordinator = NukiCoordinator(hass, api, scan_interval)
+    coordinator.async_set_updated_data(smartlocks_by_id(smartlocks))
+    
     # Store config entry data
     hass.data[DOMAIN][entry.entry_id] = {
         "api": api,
         "smartlocks": smartlocks,
+        "coordinator": coordinator,
+        "capabilities": capabilities,
         "config_entry": entry,
     }
     
@@ -66,12 +99,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+def _get_capabilities(smartlock: dict) -> dict:
+    """Return the optional features available on a smartlock."""
+    config = smartlock.get("config", {})
+    state = smartlock.get("state", {})
+    has_keypad = bool(config.get("keypadPaired", False) or config.get("keypad2Paired", False))
+    # doorState 0 means no door sensor is available
+    has_door_sensor = state.get("doorState", 0) != 0
+    
+    return {
+        "has_keypad": has_keypad,
+        "has_door_sensor": has_door_sensor,
+        "has_keypad_battery": has_keypad and "keypadBatteryCritical" in state,
+        "has_door_sensor_battery": has_door_sensor and "doorsensorBatteryCritical" in state,
+    }
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        await entry_data["api"].close()
     
     return unload_ok
 
@@ -83,6 +133,8 @@ async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
 
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up services for Nuki integration."""
+    if hass.services.has_service(DOMAIN, SERVICE_DEBUG_LAST_ACCESS):
+        return
     
     async def handle_debug_last_access(call: ServiceCall) -> None:
         """Debug service to show last access detection logic."""
@@ -115,14 +167,18 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             _LOGGER.info("Retrieved %d log entries from API", len(logs))
             
             # Show first 5 entries with keypad detection
-            for i, log_entry in enumerate(logs[:5]):
-                trigger = log_entry.get("trigger")
-                source = log_entry.get("source", 0)
-                user_name = log_entry.get("name", "")
-                state = log_entry.get("state", 0)
-                date = log_entry.get("date", "")
+            for i, log_entry in enumerate(logs):
+                if i >= 5:
+                    break
+                
+                get = log_entry.get
+                trigger = get("trigger")
+                source = get("source", 0)
+                user_name = get("name", "")
+                state = get("state", 0)
+                date = get("date", "")
                 
-                is_keypad = trigger == 255 and source in [1, 2]
+                is_keypad = trigger == 255 and source in (1, 2)
                 
                 _LOGGER.info("Entry %d: trigger=%s, source=%s, name='%s', state=%s, date=%s, IS_KEYPAD=%s", 
                            i, trigger, source, user_name, state, date, is_keypad)
@@ -140,7 +196,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             import traceback
             _LOGGER.error("Traceback: %s", traceback.format_exc())
     
-    # Register debug service
-    hass.services.async_register(DOMAIN, "debug_last_access", handle_debug_last_access)
+    # Register services; unlatch and lock_n_go are entity services registered by the lock platform
+    hass.services.async_register(DOMAIN, SERVICE_DEBUG_LAST_ACCESS, handle_debug_last_access)
     
-    _LOGGER.info("Nuki debug service registered")
\ No newline at end of file
+    _LOGGER.info("Nuki services registered")
\ No newline at end of file
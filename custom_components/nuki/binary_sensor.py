@@ -3,25 +3,164 @@ Nuki Smart Lock Binary Sensor Platform
 Provides door state and connectivity sensors based on real API data
 """
 import logging
-from datetime import datetime
-from typing import Any, Dict, Optional
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
+    BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
     DEVICE_TYPE_SMARTLOCK,
 )
+from .coordinator import device_info
 
 _LOGGER = logging.getLogger(__name__)
 
+_MISSING = object()
+
+# Shared read-only default for missing nested sections of the smartlock data
+_EMPTY: Mapping = MappingProxyType({})
+
+# Door sensor states: 0 = unavailable, 1 = deactivated, 2 = door closed,
+# 3 = door opened, 4 = door state unknown, 5 = calibrating
+DOOR_STATE_TEXT = (
+    "unavailable",
+    "deactivated",
+    "door closed",
+    "door opened",
+    "door state unknown",
+    "calibrating",
+)
+
+# is_on per door state: only "door closed" (2) and "door opened" (3) are known
+DOOR_IS_ON = (None, None, False, True, None, None)
+
+DOOR_STATE_ICONS = {True: "mdi:door-open", False: "mdi:door-closed", None: "mdi:door"}
+
+
+def _door_state_text(door_state: int) -> str:
+    """Return the text for a raw door state."""
+    if isinstance(door_state, int) and 0 <= door_state < len(DOOR_STATE_TEXT):
+        return DOOR_STATE_TEXT[door_state]
+    return f"unknown({door_state})"
+
+
+@dataclass(frozen=True, kw_only=True)
+class NukiBinarySensorEntityDescription(BinarySensorEntityDescription):
+    """Describes a Nuki binary sensor derived from smartlock data."""
+    
+    value_fn: Callable[[Dict[str, Any]], Optional[bool]]
+    attrs_fn: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+    exists_fn: Callable[[Dict[str, bool]], bool] = lambda caps: True
+    unique_id_format: str = "nuki_smartlock_{smartlock_id}_{key}"
+    on_icon: str
+    off_icon: str
+    unknown_icon: Optional[str] = None
+
+
+def _battery_critical(key: str) -> Callable[[Dict[str, Any]], Optional[bool]]:
+    """Return a value function for a battery critical flag in the smartlock state."""
+    def value_fn(data: Dict[str, Any]) -> Optional[bool]:
+        value = data.get("state", _EMPTY).get(key, _MISSING)
+        # True = battery critical/low, False = battery OK
+        return None if value is _MISSING else bool(value)
+    return value_fn
+
+
+def _auto_lock_attrs(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the auto lock timeout attributes."""
+    timeout = (data.get("advancedConfig") or _EMPTY).get("autoLockTimeout")
+    # Leave the attributes out when the API reports no usable timeout
+    if not isinstance(timeout, (int, float)):
+        return {}
+    return {"timeout_seconds": timeout, "timeout_minutes": timeout / 60}
+
+
+BINARY_SENSOR_DESCRIPTIONS = (
+    NukiBinarySensorEntityDescription(
+        key="connectivity",
+        name="Connection",
+        device_class=BinarySensorDeviceClass.CONNECTIVITY,
+        unique_id_format="nuki_smartlock_{smartlock_id}_connection",
+        # Having data means the lock is connected; serverState != 0 indicates connectivity issues
+        value_fn=lambda data: data.get("serverState", 0) == 0,
+        on_icon="mdi:wifi",
+        off_icon="mdi:wifi-off",
+    ),
+    NukiBinarySensorEntityDescription(
+        key="keypad_battery",
+        name="Keypad Battery",
+        device_class=BinarySensorDeviceClass.BATTERY,
+        exists_fn=lambda caps: caps["has_keypad_battery"],
+        unique_id_format="nuki_keypad_{smartlock_id}_battery",
+        value_fn=_battery_critical("keypadBatteryCritical"),
+        on_icon="mdi:battery-alert",
+        off_icon="mdi:battery",
+        unknown_icon="mdi:battery-unknown",
+    ),
+    NukiBinarySensorEntityDescription(
+        key="doorsensor_battery",
+        name="Door Sensor Battery",
+        device_class=BinarySensorDeviceClass.BATTERY,
+        exists_fn=lambda caps: caps["has_door_sensor_battery"],
+        unique_id_format="nuki_doorsensor_{smartlock_id}_battery",
+        value_fn=_battery_critical("doorsensorBatteryCritical"),
+        on_icon="mdi:battery-alert",
+        off_icon="mdi:battery",
+        unknown_icon="mdi:battery-unknown",
+    ),
+    NukiBinarySensorEntityDescription(
+        key="auto_lock",
+        name="Auto Lock",
+        value_fn=lambda data: bool((data.get("advancedConfig") or _EMPTY).get("autoLock", False)),
+        attrs_fn=_auto_lock_attrs,
+        on_icon="mdi:timer-lock",
+        off_icon="mdi:timer-lock-outline",
+    ),
+    NukiBinarySensorEntityDescription(
+        key="battery_charging",
+        name="Battery Charging",
+        device_class=BinarySensorDeviceClass.BATTERY_CHARGING,
+        value_fn=lambda data: bool(data.get("state", _EMPTY).get("batteryCharging", False)),
+        on_icon="mdi:battery-charging",
+        off_icon="mdi:battery",
+    ),
+    NukiBinarySensorEntityDescription(
+        key="night_mode",
+        name="Night Mode",
+        value_fn=lambda data: bool(data.get("state", _EMPTY).get("nightMode", False)),
+        on_icon="mdi:weather-night",
+        off_icon="mdi:weather-sunny",
+    ),
+    NukiBinarySensorEntityDescription(
+        key="wifi_enabled",
+        name="WiFi Enabled",
+        device_class=BinarySensorDeviceClass.CONNECTIVITY,
+        value_fn=lambda data: bool(data.get("config", _EMPTY).get("wifiEnabled", False)),
+        on_icon="mdi:wifi",
+        off_icon="mdi:wifi-off",
+    ),
+    NukiBinarySensorEntityDescription(
+        key="auto_unlatch",
+        name="Auto Unlatch",
+        value_fn=lambda data: bool(data.get("config", _EMPTY).get("autoUnlatch", False)),
+        attrs_fn=lambda data: {
+            "unlatch_duration_seconds": (data.get("advancedConfig") or _EMPTY).get("unlatchDuration", 3)
+        },
+        on_icon="mdi:door-open",
+        off_icon="mdi:door-closed-lock",
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -30,161 +169,65 @@ async def async_setup_entry(
 ) -> None:
     """Set up Nuki binary sensors from config entry."""
     data = hass.data[DOMAIN][config_entry.entry_id]
-    api = data["api"]
+    coordinator = data["coordinator"]
     smartlocks = data["smartlocks"]
-    
-    entities = []
-    
-    # Create binary sensors for each smartlock
-    for smartlock in smartlocks:
-        smartlock_id = smartlock["smartlockId"]
-        smartlock_name = smartlock.get('name', 'Unknown Lock')
-        
-        # Always create connectivity sensor
-        entities.append(
-            NukiConnectivitySensor(
-                api=api,
-                smartlock_id=smartlock_id,
-                smartlock_name=smartlock_name,
-                config_entry=config_entry,
-            )
-        )
-        
-        # Check if keypad is paired and create keypad battery binary sensor
-        config = smartlock.get("config", {})
-        keypad_paired = config.get("keypadPaired", False) or config.get("keypad2Paired", False)
-        
-        if keypad_paired and "keypadBatteryCritical" in smartlock.get("state", {}):
-            entities.append(
-                NukiKeypadBatteryBinarySensor(
-                    api=api,
-                    smartlock_id=smartlock_id,
-                    smartlock_name=smartlock_name,
-                    config_entry=config_entry,
-                )
-            )
-            _LOGGER.info("Added keypad battery binary sensor for lock %s", smartlock_name)
-        
-        # Check if door sensor is available and create door state sensor and battery binary sensor
-        state = smartlock.get("state", {})
-        door_state = state.get("doorState", 0)
-        
-        # Only create door sensor entities if door sensor is available (doorState != 0)
-        if door_state != 0:
-            # Door state sensor
-            entities.append(
-                NukiDoorStateSensor(
-                    api=api,
-                    smartlock_id=smartlock_id,
-                    smartlock_name=smartlock_name,
-                    config_entry=config_entry,
-                )
-            )
-            
-            # Door sensor battery binary sensor
-            if "doorsensorBatteryCritical" in state:
-                entities.append(
-                    NukiDoorSensorBatteryBinarySensor(
-                        api=api,
-                        smartlock_id=smartlock_id,
-                        smartlock_name=smartlock_name,
-                        config_entry=config_entry,
-                    )
-                )
-                _LOGGER.info("Added door sensor battery binary sensor for lock %s (doorState: %d)", 
-                           smartlock_name, door_state)
-            
-            _LOGGER.info("Added door state sensor for lock %s (doorState: %d)", 
-                       smartlock_name, door_state)
-        else:
-            _LOGGER.debug("No door sensor available for lock %s (doorState: 0 - unavailable)", 
-                         smartlock_name)
-        
-        # Add new binary sensors
-        entities.append(
-            NukiAutoLockBinarySensor(
-                api=api,
-                smartlock_id=smartlock_id,
-                smartlock_name=smartlock_name,
-                config_entry=config_entry,
-            )
-        )
-        
-        entities.append(
-            NukiBatteryChargingBinarySensor(
-                api=api,
-                smartlock_id=smartlock_id,
-                smartlock_name=smartlock_name,
-                config_entry=config_entry,
-            )
-        )
-        
-        entities.append(
-            NukiNightModeBinarySensor(
-                api=api,
-                smartlock_id=smartlock_id,
-                smartlock_name=smartlock_name,
-                config_entry=config_entry,
-            )
-        )
-        
-        entities.append(
-            NukiWiFiEnabledBinarySensor(
-                api=api,
-                smartlock_id=smartlock_id,
-                smartlock_name=smartlock_name,
-                config_entry=config_entry,
-            )
-        )
-        
-        entities.append(
-            NukiAutoUnlatchBinarySensor(
-                api=api,
-                smartlock_id=smartlock_id,
-                smartlock_name=smartlock_name,
-                config_entry=config_entry,
-            )
+    capabilities = data["capabilities"]
+    
+    entities = [
+        NukiDoorStateSensor(coordinator, smartlock["smartlockId"], smartlock.get('name', 'Unknown Lock'), config_entry)
+        for smartlock in smartlocks
+        # Only create door sensor entities if door sensor is available
+        if capabilities[smartlock["smartlockId"]]["has_door_sensor"]
+    ]
+    entities.extend(
+        NukiGenericBinarySensor(
+            coordinator, smartlock["smartlockId"], smartlock.get('name', 'Unknown Lock'), config_entry, description
         )
+        for smartlock in smartlocks
+        for description in _descriptions_for(capabilities[smartlock["smartlockId"]])
+    )
     
     if entities:
-        async_add_entities(entities, True)
-        _LOGGER.info("Successfully set up %d Nuki binary sensor(s)", len(entities))
+        async_add_entities(entities)
+        _LOGGER.info("Successfully set up %d Nuki binary sensor(s) for %d lock(s)", len(entities), len(smartlocks))
+
 
+def _descriptions_for(caps: Dict[str, bool]) -> list:
+    """Return the binary sensor descriptions a smartlock supports."""
+    return [description for description in BINARY_SENSOR_DESCRIPTIONS if description.exists_fn(caps)]
 
-class NukiBinaryBaseSensor(BinarySensorEntity):
+
+class NukiBinaryBaseSensor(CoordinatorEntity, BinarySensorEntity):
     """Base class for Nuki binary sensors."""
     
     def __init__(
         self,
-        api,
+        coordinator,
         smartlock_id: int,
         smartlock_name: str,
         config_entry: ConfigEntry,
         sensor_type: str,
     ):
         """Initialize the binary sensor."""
-        self._api = api
+        super().__init__(coordinator)
         self._smartlock_id = smartlock_id
         self._smartlock_name = smartlock_name
         self._config_entry = config_entry
         self._sensor_type = sensor_type
         
+        self._attr_device_info = device_info(smartlock_id, smartlock_name)
+        
+        # Options changes reload the entry, so the flag can be read once
+        self._enhanced_logging = config_entry.options.get("enable_enhanced_logging", False)
+        
         # State tracking
         self._attr_is_on = None
-        self._attr_available = True
-        self._last_update = None
+        self._written_snapshot: Optional[tuple] = None
     
     @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, str(self._smartlock_id))},
-            name=self._smartlock_name,
-            manufacturer="Nuki",
-            model="Smart Lock Ultra" if "Ultra" in self._smartlock_name else "Smart Lock",
-            sw_version=None,
-            via_device=None,
-        )
+    def available(self) -> bool:
+        """Return if the smartlock is still reported by the API."""
+        return super().available and self._smartlock_id in self.coordinator.data
     
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
@@ -192,394 +235,139 @@ class NukiBinaryBaseSensor(BinarySensorEntity):
         attrs = {
             "smartlock_id": self._smartlock_id,
             "sensor_type": self._sensor_type,
-            "last_update": self._last_update,
+            "last_update": self.coordinator.last_fetch.isoformat(),
         }
         return attrs
     
-    @property 
-    def _enhanced_logging(self) -> bool:
-        """Check if enhanced logging is enabled."""
-        return self._config_entry.options.get("enable_enhanced_logging", False)
+    async def async_added_to_hass(self) -> None:
+        """Run when entity is added to hass."""
+        await super().async_added_to_hass()
+        if self.available:
+            self._update_from_smartlock_data(self.coordinator.data[self._smartlock_id])
 
-    async def async_update(self) -> None:
-        """Update the sensor state."""
-        try:
-            # Get full smartlock data including config
-            data = await self._api.get_smartlock_full_data(self._smartlock_id)
-            self._update_from_smartlock_data(data)
-            
-            self._attr_available = True
-            self._last_update = datetime.now().isoformat()
-            
-        except Exception as ex:
-            _LOGGER.error("Error updating binary sensor %s: %s", self._attr_name, ex)
-            self._attr_available = False
-            self._attr_is_on = False
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if self.available:
+            self._update_from_smartlock_data(self.coordinator.data[self._smartlock_id])
+        
+        # Most values change rarely; skip the state write when nothing changed.
+        # Compared with the last written values, since availability has already
+        # changed by the time this handler runs.
+        snapshot = self._state_snapshot()
+        if snapshot == self._written_snapshot:
+            return
+        self._written_snapshot = snapshot
+        super()._handle_coordinator_update()
+    
+    def _state_snapshot(self) -> tuple:
+        """Return the values that make up the written state."""
+        return (self.available, self._attr_is_on)
     
     def _update_from_smartlock_data(self, data: Dict) -> None:
         """Update sensor from smartlock API data - to be implemented by subclasses."""
         raise NotImplementedError
 
 
-class NukiConnectivitySensor(NukiBinaryBaseSensor):
-    """Connectivity sensor for Nuki Smart Lock."""
-    
-    def __init__(self, api, smartlock_id: int, smartlock_name: str, config_entry: ConfigEntry):
-        """Initialize the connectivity sensor."""
-        super().__init__(api, smartlock_id, smartlock_name, config_entry, "connectivity")
-        
-        self._attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
-        self._attr_name = f"{smartlock_name} Connection"
-        self._attr_unique_id = f"nuki_smartlock_{smartlock_id}_connection"
-    
-    def _update_from_smartlock_data(self, data: Dict) -> None:
-        """Update sensor from smartlock API data."""
-        try:
-            # If we got data, the lock is connected
-            self._attr_is_on = True
-            
-            # Check server state for additional connectivity info
-            server_state = data.get("serverState", 0)
-            if server_state != 0:
-                # serverState != 0 might indicate connectivity issues
-                self._attr_is_on = False
-                        
-        except Exception as ex:
-            _LOGGER.error("Error parsing connectivity data: %s", ex)
-            self._attr_is_on = False
-    
-    @property
-    def icon(self) -> str:
-        """Return the icon for the sensor."""
-        return "mdi:wifi" if self._attr_is_on else "mdi:wifi-off"
-
-
 class NukiDoorStateSensor(NukiBinaryBaseSensor):
     """Door state sensor for Nuki Smart Lock."""
     
-    def __init__(self, api, smartlock_id: int, smartlock_name: str, config_entry: ConfigEntry):
+    def __init__(self, coordinator, smartlock_id: int, smartlock_name: str, config_entry: ConfigEntry):
         """Initialize the door state sensor."""
-        super().__init__(api, smartlock_id, smartlock_name, config_entry, "door")
+        super().__init__(coordinator, smartlock_id, smartlock_name, config_entry, "door")
         
         self._attr_device_class = BinarySensorDeviceClass.DOOR
         self._attr_name = f"{smartlock_name} Door"
         self._attr_unique_id = f"nuki_smartlock_{smartlock_id}_door"
         
+        self._attr_icon = DOOR_STATE_ICONS[None]
+        
         # Additional state tracking
         self._door_state_value = None
     
-    def _update_from_smartlock_data(self, data: Dict) -> None:
-        """Update sensor from smartlock API data."""
-        try:
-            state = data.get("state", {})
-            
-            if "doorState" in state:
-                door_state = state["doorState"]
-                self._door_state_value = door_state
-                
-                # Updated door state mapping based on correct values:
-                # 0 = unavailable, 1 = deactivated, 2 = door closed, 3 = door opened, 
-                # 4 = door state unknown, 5 = calibrating
-                if door_state == 3:
-                    self._attr_is_on = True  # Door opened
-                elif door_state == 2:
-                    self._attr_is_on = False  # Door closed
-                else:
-                    # For states 0,1,4,5 - treat as unknown/unavailable
-                    self._attr_is_on = None
-                    
-                if self._enhanced_logging:
-                    door_state_text = {
-                        0: "unavailable",
-                        1: "deactivated", 
-                        2: "door closed",
-                        3: "door opened",
-                        4: "door state unknown",
-                        5: "calibrating"
-                    }.get(door_state, f"unknown({door_state})")
-                    
-                    _LOGGER.debug("Door state: %s (raw: %s)", door_state_text, door_state)
-            else:
-                self._attr_is_on = None
-                        
-        except Exception as ex:
-            _LOGGER.error("Error parsing door state data: %s", ex)
-            self._attr_is_on = None
-    
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return additional state attributes."""
-        attrs = super().extra_state_attributes
-        if self._door_state_value is not None:
-            attrs["door_state_raw"] = self._door_state_value
-            attrs["door_state_text"] = {
-                0: "unavailable",
-                1: "deactivated", 
-                2: "door closed",
-                3: "door opened",
-                4: "door state unknown",
-                5: "calibrating"
-            }.get(self._door_state_value, f"unknown({self._door_state_value})")
-        return attrs
-    
-    @property
-    def icon(self) -> str:
-        """Return the icon for the sensor."""
-        if self._attr_is_on is True:
-            return "mdi:door-open"
-        elif self._attr_is_on is False:
-            return "mdi:door-closed"
-        else:
-            return "mdi:door"
-
-
-class NukiKeypadBatteryBinarySensor(NukiBinaryBaseSensor):
-    """Keypad battery binary sensor for Nuki Smart Lock."""
-    
-    def __init__(self, api, smartlock_id: int, smartlock_name: str, config_entry: ConfigEntry):
-        """Initialize the keypad battery binary sensor."""
-        super().__init__(api, smartlock_id, smartlock_name, config_entry, "keypad_battery")
-        
-        self._attr_device_class = BinarySensorDeviceClass.BATTERY
-        self._attr_name = f"{smartlock_name} Keypad Battery"
-        self._attr_unique_id = f"nuki_keypad_{smartlock_id}_battery"
+    def _state_snapshot(self) -> tuple:
+        """Return the values that make up the written state."""
+        return (*super()._state_snapshot(), self._door_state_value)
     
     def _update_from_smartlock_data(self, data: Dict) -> None:
         """Update sensor from smartlock API data."""
-        try:
-            state = data.get("state", {})
-            
-            if "keypadBatteryCritical" in state:
-                # Binary sensor: True = battery critical/low, False = battery OK
-                self._attr_is_on = bool(state["keypadBatteryCritical"])
-                
-                if self._enhanced_logging:
-                    _LOGGER.debug("Keypad battery critical: %s", self._attr_is_on)
-            else:
-                self._attr_is_on = None
-                        
-        except Exception as ex:
-            _LOGGER.error("Error parsing keypad battery data: %s", ex)
+        door_state = data.get("state", _EMPTY).get("doorState")
+        if door_state is None:
             self._attr_is_on = None
-    
-    @property
-    def icon(self) -> str:
-        """Return the icon for the sensor."""
-        if self._attr_is_on is True:
-            return "mdi:battery-alert"
-        elif self._attr_is_on is False:
-            return "mdi:battery"
-        else:
-            return "mdi:battery-unknown"
-
-
-class NukiDoorSensorBatteryBinarySensor(NukiBinaryBaseSensor):
-    """Door sensor battery binary sensor for Nuki Smart Lock."""
-    
-    def __init__(self, api, smartlock_id: int, smartlock_name: str, config_entry: ConfigEntry):
-        """Initialize the door sensor battery binary sensor."""
-        super().__init__(api, smartlock_id, smartlock_name, config_entry, "doorsensor_battery")
+            self._attr_icon = DOOR_STATE_ICONS[None]
+            return
         
-        self._attr_device_class = BinarySensorDeviceClass.BATTERY
-        self._attr_name = f"{smartlock_name} Door Sensor Battery"
-        self._attr_unique_id = f"nuki_doorsensor_{smartlock_id}_battery"
-    
-    def _update_from_smartlock_data(self, data: Dict) -> None:
-        """Update sensor from smartlock API data."""
-        try:
-            state = data.get("state", {})
-            
-            if "doorsensorBatteryCritical" in state:
-                # Binary sensor: True = battery critical/low, False = battery OK
-                self._attr_is_on = bool(state["doorsensorBatteryCritical"])
-                
-                if self._enhanced_logging:
-                    _LOGGER.debug("Door sensor battery critical: %s", self._attr_is_on)
-            else:
-                self._attr_is_on = None
-                        
-        except Exception as ex:
-            _LOGGER.error("Error parsing door sensor battery data: %s", ex)
-            self._attr_is_on = None
-    
-    @property
-    def icon(self) -> str:
-        """Return the icon for the sensor."""
-        if self._attr_is_on is True:
-            return "mdi:battery-alert"
-        elif self._attr_is_on is False:
-            return "mdi:battery"
-        else:
-            return "mdi:battery-unknown"
-
-
-class NukiAutoLockBinarySensor(NukiBinaryBaseSensor):
-    """Binary sensor showing if auto lock is enabled."""
-    
-    def __init__(self, api, smartlock_id: int, smartlock_name: str, config_entry: ConfigEntry):
-        """Initialize the auto lock binary sensor."""
-        super().__init__(api, smartlock_id, smartlock_name, config_entry, "auto_lock")
+        self._door_state_value = door_state
         
-        self._attr_name = f"{smartlock_name} Auto Lock"
-        self._attr_unique_id = f"nuki_smartlock_{smartlock_id}_auto_lock"
-        self._timeout = None
-    
-    def _update_from_smartlock_data(self, data: Dict) -> None:
-        """Update sensor from smartlock API data."""
-        try:
-            advanced_config = data.get("advancedConfig", {})
-            self._attr_is_on = bool(advanced_config.get("autoLock", False))
-            self._timeout = advanced_config.get("autoLockTimeout", 0)
-            
-            if self._enhanced_logging:
-                _LOGGER.debug("Auto lock binary update: enabled=%s, timeout=%s seconds", 
-                            self._attr_is_on, self._timeout)
-                        
-        except Exception as ex:
-            _LOGGER.error("Error parsing auto lock data: %s", ex)
+        # States 0, 1, 4 and 5 are treated as unknown/unavailable
+        if isinstance(door_state, int) and 0 <= door_state < len(DOOR_IS_ON):
+            self._attr_is_on = DOOR_IS_ON[door_state]
+        else:
             self._attr_is_on = None
+        self._attr_icon = DOOR_STATE_ICONS[self._attr_is_on]
+        
+        if self._enhanced_logging and _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Door state: %s (raw: %s)", _door_state_text(door_state), door_state)
     
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return additional state attributes."""
         attrs = super().extra_state_attributes
-        if self._timeout is not None:
-            attrs["timeout_seconds"] = self._timeout
-            attrs["timeout_minutes"] = self._timeout / 60
+        if self._door_state_value is not None:
+            attrs["door_state_raw"] = self._door_state_value
+            attrs["door_state_text"] = _door_state_text(self._door_state_value)
         return attrs
-    
-    @property
-    def icon(self) -> str:
-        """Return the icon for the sensor."""
-        return "mdi:timer-lock" if self._attr_is_on else "mdi:timer-lock-outline"
 
 
-class NukiBatteryChargingBinarySensor(NukiBinaryBaseSensor):
-    """Binary sensor showing if battery is charging."""
-    
-    def __init__(self, api, smartlock_id: int, smartlock_name: str, config_entry: ConfigEntry):
-        """Initialize the battery charging binary sensor."""
-        super().__init__(api, smartlock_id, smartlock_name, config_entry, "battery_charging")
-        
-        self._attr_device_class = BinarySensorDeviceClass.BATTERY_CHARGING
-        self._attr_name = f"{smartlock_name} Battery Charging"
-        self._attr_unique_id = f"nuki_smartlock_{smartlock_id}_battery_charging"
+class NukiGenericBinarySensor(NukiBinaryBaseSensor):
+    """Binary sensor driven by a NukiBinarySensorEntityDescription."""
     
-    def _update_from_smartlock_data(self, data: Dict) -> None:
-        """Update sensor from smartlock API data."""
-        try:
-            state = data.get("state", {})
-            self._attr_is_on = bool(state.get("batteryCharging", False))
-            
-            if self._enhanced_logging:
-                _LOGGER.debug("Battery charging binary update: %s", self._attr_is_on)
-                        
-        except Exception as ex:
-            _LOGGER.error("Error parsing battery charging data: %s", ex)
-            self._attr_is_on = None
+    entity_description: NukiBinarySensorEntityDescription
     
-    @property
-    def icon(self) -> str:
-        """Return the icon for the sensor."""
-        return "mdi:battery-charging" if self._attr_is_on else "mdi:battery"
-
-
-class NukiNightModeBinarySensor(NukiBinaryBaseSensor):
-    """Binary sensor showing if night mode is active."""
-    
-    def __init__(self, api, smartlock_id: int, smartlock_name: str, config_entry: ConfigEntry):
-        """Initialize the night mode binary sensor."""
-        super().__init__(api, smartlock_id, smartlock_name, config_entry, "night_mode")
+    def __init__(
+        self,
+        coordinator,
+        smartlock_id: int,
+        smartlock_name: str,
+        config_entry: ConfigEntry,
+        description: NukiBinarySensorEntityDescription,
+    ):
+        """Initialize the binary sensor."""
+        super().__init__(coordinator, smartlock_id, smartlock_name, config_entry, description.key)
+        self.entity_description = description
         
-        self._attr_name = f"{smartlock_name} Night Mode"
-        self._attr_unique_id = f"nuki_smartlock_{smartlock_id}_night_mode"
-    
-    def _update_from_smartlock_data(self, data: Dict) -> None:
-        """Update sensor from smartlock API data."""
-        try:
-            state = data.get("state", {})
-            self._attr_is_on = bool(state.get("nightMode", False))
-            
-            if self._enhanced_logging:
-                _LOGGER.debug("Night mode binary update: %s", self._attr_is_on)
-                        
-        except Exception as ex:
-            _LOGGER.error("Error parsing night mode data: %s", ex)
-            self._attr_is_on = None
-    
-    @property
-    def icon(self) -> str:
-        """Return the icon for the sensor."""
-        return "mdi:weather-night" if self._attr_is_on else "mdi:weather-sunny"
-
-
-class NukiWiFiEnabledBinarySensor(NukiBinaryBaseSensor):
-    """Binary sensor showing if WiFi is enabled."""
+        self._attr_name = f"{smartlock_name} {description.name}"
+        self._attr_unique_id = description.unique_id_format.format(
+            smartlock_id=smartlock_id, key=description.key
+        )
+        self._extra_attrs: Dict[str, Any] = {}
+        self._attr_icon = self._icon_for(None)
     
-    def __init__(self, api, smartlock_id: int, smartlock_name: str, config_entry: ConfigEntry):
-        """Initialize the WiFi enabled binary sensor."""
-        super().__init__(api, smartlock_id, smartlock_name, config_entry, "wifi_enabled")
-        
-        self._attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
-        self._attr_name = f"{smartlock_name} WiFi Enabled"
-        self._attr_unique_id = f"nuki_smartlock_{smartlock_id}_wifi_enabled"
+    def _state_snapshot(self) -> tuple:
+        """Return the values that make up the written state."""
+        return (*super()._state_snapshot(), self._extra_attrs)
     
     def _update_from_smartlock_data(self, data: Dict) -> None:
         """Update sensor from smartlock API data."""
-        try:
-            config = data.get("config", {})
-            self._attr_is_on = bool(config.get("wifiEnabled", False))
-            
-            if self._enhanced_logging:
-                _LOGGER.debug("WiFi enabled binary update: %s", self._attr_is_on)
-                        
-        except Exception as ex:
-            _LOGGER.error("Error parsing WiFi enabled data: %s", ex)
-            self._attr_is_on = None
-    
-    @property
-    def icon(self) -> str:
-        """Return the icon for the sensor."""
-        return "mdi:wifi" if self._attr_is_on else "mdi:wifi-off"
-
-
-class NukiAutoUnlatchBinarySensor(NukiBinaryBaseSensor):
-    """Binary sensor showing if auto unlatch is enabled."""
-    
-    def __init__(self, api, smartlock_id: int, smartlock_name: str, config_entry: ConfigEntry):
-        """Initialize the auto unlatch binary sensor."""
-        super().__init__(api, smartlock_id, smartlock_name, config_entry, "auto_unlatch")
+        description = self.entity_description
+        self._attr_is_on = description.value_fn(data)
+        self._attr_icon = self._icon_for(self._attr_is_on)
+        if description.attrs_fn:
+            self._extra_attrs = description.attrs_fn(data)
         
-        self._attr_name = f"{smartlock_name} Auto Unlatch"
-        self._attr_unique_id = f"nuki_smartlock_{smartlock_id}_auto_unlatch"
-        self._unlatch_duration = None
-    
-    def _update_from_smartlock_data(self, data: Dict) -> None:
-        """Update sensor from smartlock API data."""
-        try:
-            config = data.get("config", {})
-            self._attr_is_on = bool(config.get("autoUnlatch", False))
-            
-            advanced_config = data.get("advancedConfig", {})
-            self._unlatch_duration = advanced_config.get("unlatchDuration", 3)
-            
-            if self._enhanced_logging:
-                _LOGGER.debug("Auto unlatch binary update: enabled=%s, duration=%s seconds", 
-                            self._attr_is_on, self._unlatch_duration)
-                        
-        except Exception as ex:
-            _LOGGER.error("Error parsing auto unlatch data: %s", ex)
-            self._attr_is_on = None
+        if self._enhanced_logging and _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("%s binary update: %s %s", description.key, self._attr_is_on, self._extra_attrs)
     
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return additional state attributes."""
         attrs = super().extra_state_attributes
-        if self._unlatch_duration is not None:
-            attrs["unlatch_duration_seconds"] = self._unlatch_duration
+        attrs.update(self._extra_attrs)
         return attrs
     
-    @property
-    def icon(self) -> str:
-        """Return the icon for the sensor."""
-        return "mdi:door-open" if self._attr_is_on else "mdi:door-closed-lock"
\ No newline at end of file
+    def _icon_for(self, is_on: Optional[bool]) -> str:
+        """Return the description icon for a sensor value."""
+        description = self.entity_description
+        if is_on is None and description.unknown_icon:
+            return description.unknown_icon
+        return description.on_icon if is_on else description.off_icon
@@ -2,16 +2,17 @@
 Nuki Smart Lock Button Platform
 Provides action buttons for Smart Lock operations
 """
+import asyncio
 import logging
-from typing import Any
+from typing import Any, Optional
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, NUKI_ACTIONS
+from .const import DOMAIN, NUKI_ACTIONS, BUTTON_PRESS_DEBOUNCE
+from .coordinator import device_info
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -77,7 +78,9 @@ class NukiBaseButton(ButtonEntity):
         self._api = api
         self._smartlock_id = smartlock_id
         self._smartlock_name = smartlock_name
+        self._attr_device_info = device_info(self._smartlock_id, self._smartlock_name)
         self._config_entry = config_entry
+        self._enhanced_logging = config_entry.options.get("enable_enhanced_logging", False)
         self._button_type = button_type
         self._action_name = action_name
         self._nuki_action = nuki_action
@@ -86,18 +89,10 @@ class NukiBaseButton(ButtonEntity):
         self._attr_name = f"{smartlock_name} {action_name}"
         self._attr_unique_id = f"nuki_smartlock_{smartlock_id}_{button_type}"
         self._attr_available = True
-    
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, str(self._smartlock_id))},
-            name=self._smartlock_name,
-            manufacturer="Nuki",
-            model="Smart Lock Ultra" if "Ultra" in self._smartlock_name else "Smart Lock",
-            sw_version=None,
-            via_device=None,
-        )
+        
+        # Press debouncing
+        self._inflight: Optional[asyncio.Task] = None
+        self._last_pressed = 0.0
     
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -110,6 +105,23 @@ class NukiBaseButton(ButtonEntity):
     
     async def async_press(self) -> None:
         """Handle the button press."""
+        if self._inflight is not None and not self._inflight.done():
+            _LOGGER.debug("%s for lock %s already in progress, ignoring press", 
+                        self._action_name, self._smartlock_name)
+            return
+        
+        now = self.hass.loop.time()
+        if now - self._last_pressed < BUTTON_PRESS_DEBOUNCE:
+            _LOGGER.debug("Ignoring repeated %s press for lock %s", self._action_name, self._smartlock_name)
+            return
+        self._last_pressed = now
+        
+        # Shield the request so a cancelled service call doesn't abort a command already sent
+        self._inflight = self.hass.async_create_task(self._async_send_action(), eager_start=True)
+        await asyncio.shield(self._inflight)
+    
+    async def _async_send_action(self) -> None:
+        """Send the button's action to the API."""
         try:
             _LOGGER.info("Executing %s for lock %s", self._action_name, self._smartlock_name)
             
@@ -125,11 +137,6 @@ class NukiBaseButton(ButtonEntity):
             _LOGGER.error("Error executing %s for %s: %s", self._action_name, self._smartlock_name, ex)
             # Note: We don't raise the exception to avoid showing errors in UI for temporary issues
     
-    @property 
-    def _enhanced_logging(self) -> bool:
-        """Check if enhanced logging is enabled."""
-        return self._config_entry.options.get("enable_enhanced_logging", False)
-
 
 class NukiUnlatchButton(NukiBaseButton):
     """Button to unlatch the Nuki Smart Lock."""
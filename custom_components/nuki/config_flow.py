@@ -8,18 +8,43 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+import aiohttp
 import voluptuous as vol
 
-from .const import DOMAIN, DEFAULT_SCAN_INTERVAL
-from .lock import NukiAPI
+from .const import DOMAIN, DEFAULT_SCAN_INTERVAL, API_SETUP_TIMEOUT, API_SETUP_CONNECT_TIMEOUT
+from .lock import NukiAPI, NukiAuthError, NukiConnectionError
 
 _LOGGER = logging.getLogger(__name__)
 
+# Bounds the setup form so a hung Nuki endpoint doesn't stall the flow
+_SETUP_TIMEOUT = aiohttp.ClientTimeout(total=API_SETUP_TIMEOUT, connect=API_SETUP_CONNECT_TIMEOUT)
+
+_SCAN_INTERVAL_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=10, max=300))
+
+_USER_SCHEMA = vol.Schema({
+    vol.Required(CONF_API_KEY): str,
+    vol.Optional(CONF_NAME, default="Nuki Smart Lock"): str,
+    vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): _SCAN_INTERVAL_VALIDATOR,
+})
+
+# Current option values are filled in as suggested values when the form is shown
+_OPTIONS_SCHEMA = vol.Schema({
+    vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): _SCAN_INTERVAL_VALIDATOR,
+    vol.Optional("fingerprint_detection_window", default=120): vol.All(
+        vol.Coerce(int), vol.Range(min=30, max=600)
+    ),
+    vol.Optional("enable_enhanced_logging", default=False): bool,
+})
+
 class NukiConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Nuki Smart Lock."""
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._session = None
+
     async def async_step_user(
         self, user_input: Optional[Dict[str, Any]] = None
     ) -> FlowResult:
@@ -31,46 +56,51 @@ class NukiConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             api_key = user_input[CONF_API_KEY]
             
             # Test the API connection
-            session = async_get_clientsession(self.hass)
-            api = NukiAPI(session, api_key)
+            # Reused when the form is submitted again after an error
+            if self._session is None:
+                self._session = async_get_clientsession(self.hass)
+            # No retries either, or Retry-After backoff would outlast the timeout
+            api = NukiAPI(self._session, api_key, timeout=_SETUP_TIMEOUT, max_attempts=1)
             
             try:
-                # Test connection and get smartlocks
-                if await api.test_connection():
-                    smartlocks = await api.get_smartlocks()
-                    if smartlocks:
-                        # Create a unique ID based on the first smartlock
-                        await self.async_set_unique_id(f"nuki_{smartlocks[0]['smartlockId']}")
-                        self._abort_if_unique_id_configured()
-                        
-                        title = user_input.get(CONF_NAME, "Nuki Smart Lock")
-                        if len(smartlocks) > 1:
-                            title = f"Nuki ({len(smartlocks)} locks)"
-                        
-                        return self.async_create_entry(
-                            title=title,
-                            data=user_input,
-                        )
-                    else:
-                        errors["base"] = "no_smartlocks"
-                else:
-                    errors["base"] = "invalid_auth"
+                # A successful smartlock list request also proves the token is valid
+                smartlocks = await api.get_smartlocks()
+            except NukiAuthError:
+                errors["base"] = "invalid_auth"
+            except NukiConnectionError as ex:
+                _LOGGER.debug("Nuki API unreachable: %s", ex)
+                errors["base"] = "cannot_connect"
             except Exception:
                 _LOGGER.exception("Unexpected exception during API test")
                 errors["base"] = "cannot_connect"
+            else:
+                if smartlocks:
+                    smartlock_ids = sorted(smartlock["smartlockId"] for smartlock in smartlocks)
+                    
+                    # Entries used to be keyed by whichever lock the API listed first,
+                    # so any of the account's locks identifies an existing entry
+                    current_ids = self._async_current_ids()
+                    if any(f"nuki_{smartlock_id}" in current_ids for smartlock_id in smartlock_ids):
+                        return self.async_abort(reason="already_configured")
+                    
+                    # Key the entry by the lowest smartlock ID so list ordering doesn't matter
+                    await self.async_set_unique_id(f"nuki_{smartlock_ids[0]}")
+                    self._abort_if_unique_id_configured()
+                    
+                    title = user_input.get(CONF_NAME, "Nuki Smart Lock")
+                    if len(smartlocks) > 1:
+                        title = f"Nuki ({len(smartlocks)} locks)"
+                    
+                    return self.async_create_entry(
+                        title=title,
+                        data=user_input,
+                    )
+                errors["base"] = "no_smartlocks"
 
         # Show the form
-        data_schema = vol.Schema({
-            vol.Required(CONF_API_KEY): str,
-            vol.Optional(CONF_NAME, default="Nuki Smart Lock"): str,
-            vol.Optional(CONF_SCAN_INTERVAL, default=30): vol.All(
-                vol.Coerce(int), vol.Range(min=10, max=300)
-            ),
-        })
-        
         return self.async_show_form(
             step_id="user",
-            data_schema=data_schema,
+            data_schema=_USER_SCHEMA,
             errors=errors,
         )
 
@@ -95,22 +125,7 @@ class NukiOptionsFlowHandler(config_entries.OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
-        data_schema = vol.Schema({
-            vol.Optional(
-                CONF_SCAN_INTERVAL,
-                default=self.config_entry.options.get(CONF_SCAN_INTERVAL, 30),
-            ): vol.All(vol.Coerce(int), vol.Range(min=10, max=300)),
-            vol.Optional(
-                "fingerprint_detection_window",
-                default=self.config_entry.options.get("fingerprint_detection_window", 120),
-            ): vol.All(vol.Coerce(int), vol.Range(min=30, max=600)),
-            vol.Optional(
-                "enable_enhanced_logging",
-                default=self.config_entry.options.get("enable_enhanced_logging", False),
-            ): bool,
-        })
-
         return self.async_show_form(
             step_id="init",
-            data_schema=data_schema,
+            data_schema=self.add_suggested_values_to_schema(_OPTIONS_SCHEMA, self.config_entry.options),
         )
\ No newline at end of file
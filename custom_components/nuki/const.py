@@ -1,5 +1,5 @@
 """Constants for the Nuki Smart Lock integration."""
-from datetime import timedelta
+from types import MappingProxyType
 from homeassistant.const import Platform
 from homeassistant.components.lock import LockState
 
@@ -11,7 +11,7 @@ PLATFORMS = [Platform.LOCK, Platform.SENSOR, Platform.BINARY_SENSOR, Platform.BU
 
 # Default values
 DEFAULT_NAME = "Nuki Smart Lock"
-DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
+DEFAULT_SCAN_INTERVAL = 30  # seconds
 DEFAULT_DETECTION_WINDOW = 120
 
 # Configuration keys
@@ -21,9 +21,25 @@ CONF_ENABLE_ENHANCED_LOGGING = "enable_enhanced_logging"
 
 # API Configuration
 NUKI_API_BASE = "https://api.nuki.io"
+LOGS_CACHE_TTL = 5  # seconds
+# Collapses the per-entity refreshes of a scan interval into one list request
+SMARTLOCKS_CACHE_TTL = 5  # seconds
+API_MAX_ATTEMPTS = 3
+API_MAX_CONCURRENCY = 4
+API_MAX_RETRY_DELAY = 30  # seconds
+API_REQUEST_TIMEOUT = 15  # seconds
+# Tighter bound for the setup form so a hung endpoint doesn't stall the flow
+API_SETUP_TIMEOUT = 10  # seconds
+API_SETUP_CONNECT_TIMEOUT = 5  # seconds
+
+# Presses of the same action button within this window are ignored
+BUTTON_PRESS_DEBOUNCE = 0.5  # seconds
+
+# Quiet locks check their activity log at most every this many coordinator polls
+LOG_CHECK_MAX_SKIP = 8
 
 # Nuki states mapping
-NUKI_STATES = {
+_NUKI_STATES_DICT = MappingProxyType({
     0: "uncalibrated",
     1: LockState.LOCKED,
     2: "unlocking", 
@@ -34,16 +50,19 @@ NUKI_STATES = {
     7: "unlatching",
     254: "motor blocked",
     255: "undefined"
-}
+})
+
+# Indexed by raw state ID (0-255); IDs the API doesn't define map to "unknown"
+NUKI_STATES = tuple(_NUKI_STATES_DICT.get(state_id, "unknown") for state_id in range(256))
 
 # Nuki lock actions
-NUKI_ACTIONS = {
+NUKI_ACTIONS = MappingProxyType({
     "unlock": 1,
     "lock": 2,
     "unlatch": 3,
     "lock_n_go": 4,
     "lock_n_go_with_unlatch": 5
-}
+})
 
 # Event types
 EVENT_KEYPAD_ACTION = "nuki_keypad_action"
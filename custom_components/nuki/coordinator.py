@@ -0,0 +1,62 @@
+"""
+Nuki Smart Lock Data Update Coordinator
+Fetches all smartlocks once per interval and shares the data with all entities
+"""
+import logging
+from datetime import timedelta
+from typing import Any, Dict
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class NukiCoordinator(DataUpdateCoordinator):
+    """Coordinator polling the Nuki API for all smartlocks of an account."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api,
+        update_interval: timedelta,
+    ):
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name="nuki",
+            update_interval=update_interval,
+        )
+        self.api = api
+        # Shared by all entities; set here because the coordinator
+        # is seeded with the setup data right after construction
+        self.last_fetch = dt_util.utcnow()
+
+    async def _async_update_data(self) -> Dict[int, Dict[str, Any]]:
+        """Fetch the latest data of all smartlocks with a single list request."""
+        try:
+            smartlocks = await self.api.get_smartlocks()
+        except Exception as ex:
+            raise UpdateFailed(f"Error fetching smartlocks: {ex}") from ex
+        self.last_fetch = dt_util.utcnow()
+        return smartlocks_by_id(smartlocks)
+
+
+def smartlocks_by_id(smartlocks: list) -> Dict[int, Dict[str, Any]]:
+    """Index a smartlock list by smartlock ID."""
+    return {smartlock["smartlockId"]: smartlock for smartlock in smartlocks}
+
+
+def device_info(smartlock_id: int, smartlock_name: str) -> DeviceInfo:
+    """Return the device info shared by all entities of a smartlock."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, str(smartlock_id))},
+        name=smartlock_name,
+        manufacturer="Nuki",
+        model="Smart Lock Ultra" if "Ultra" in smartlock_name else "Smart Lock",
+    )
@@ -4,11 +4,13 @@ Supports lock control and keypad event detection
 """
 import asyncio
 import logging
-from datetime import datetime, timedelta, timezone
+import random
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 import aiohttp
-import async_timeout
 import voluptuous as vol
     
 from homeassistant.components.lock import LockEntity, LockState, PLATFORM_SCHEMA
@@ -19,13 +21,13 @@ from homeassistant.const import (
     CONF_SCAN_INTERVAL,
 )
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers import config_validation as cv, device_registry as dr, entity_platform
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .const import (
     DOMAIN,
@@ -33,6 +35,13 @@ from .const import (
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_DETECTION_WINDOW,
     NUKI_API_BASE,
+    LOGS_CACHE_TTL,
+    SMARTLOCKS_CACHE_TTL,
+    LOG_CHECK_MAX_SKIP,
+    API_MAX_ATTEMPTS,
+    API_MAX_CONCURRENCY,
+    API_MAX_RETRY_DELAY,
+    API_REQUEST_TIMEOUT,
     NUKI_STATES,
     NUKI_ACTIONS,
     EVENT_KEYPAD_ACTION,
@@ -40,7 +49,10 @@ from .const import (
     CONF_FINGERPRINT_USERS,
     CONF_FINGERPRINT_DETECTION_WINDOW,
     CONF_ENABLE_ENHANCED_LOGGING,
+    SERVICE_UNLATCH,
+    SERVICE_LOCK_N_GO,
 )
+from .coordinator import NukiCoordinator, device_info, smartlocks_by_id
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -54,10 +66,30 @@ KEYPAD_TRIGGERS = {
     255: "keypad_user"
 }
 
+# Keypad log sources (1 = PIN Code, 2 = Fingerprint):
+# access method, state of a rejected credential, label, user when the API only reports "Nuki Keypad"
+KEYPAD_SOURCES = {
+    1: ("pin_code", 224, "PIN", "PIN User"),
+    2: ("fingerprint", 225, "Fingerprint", None),  # resolved through the fingerprint user mapping
+}
+
+# Manual actions other than unlock (2 = lock, 3 = unlatch) are typically done from inside
+MANUAL_ACTION_TYPES = {
+    2: "inside_handle",
+    3: "inside_handle",
+}
+
+
+@lru_cache(maxsize=128)
+def _parse_log_timestamp(log_date: str) -> datetime:
+    """Parse a log timestamp to a UTC-aware datetime."""
+    # fromisoformat handles a trailing "Z" and explicit offsets; naive dates are UTC
+    parsed = datetime.fromisoformat(log_date)
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
 # Legacy YAML platform schema (for backward compatibility)
-fingerprint_schema = {}
-for i in range(1, 21):  # 1 to 20
-    fingerprint_schema[f"source_{i}"] = cv.string
+fingerprint_schema = {f"source_{i}": cv.string for i in range(1, 21)}  # 1 to 20
 
 # Create schema with voluptuous
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend({
@@ -79,9 +111,9 @@ async def async_setup_entry(
     data = hass.data[DOMAIN][config_entry.entry_id]
     api = data["api"]
     smartlocks = data["smartlocks"]
+    coordinator = data["coordinator"]
     
     # Get options from config entry
-    scan_interval = timedelta(seconds=config_entry.options.get(CONF_SCAN_INTERVAL, 30))
     fingerprint_users = config_entry.options.get(CONF_FINGERPRINT_USERS, {})
     detection_window = config_entry.options.get(CONF_FINGERPRINT_DETECTION_WINDOW, DEFAULT_DETECTION_WINDOW)
     enhanced_logging = config_entry.options.get(CONF_ENABLE_ENHANCED_LOGGING, False)
@@ -100,10 +132,10 @@ async def async_setup_entry(
                     smartlock.get('smartlockId', 'Unknown'))
         
         lock = NukiLock(
+            coordinator=coordinator,
             api=api, 
             smartlock_data=smartlock, 
             config_entry=config_entry,
-            scan_interval=scan_interval, 
             fingerprint_users=fingerprint_users, 
             detection_window=detection_window, 
             enhanced_logging=enhanced_logging
@@ -111,8 +143,18 @@ async def async_setup_entry(
         entities.append(lock)
     
     if entities:
-        async_add_entities(entities, True)
+        async_add_entities(entities)
         _LOGGER.info("Successfully set up %d Nuki lock(s)", len(entities))
+    
+    _async_register_entity_services()
+
+
+@callback
+def _async_register_entity_services() -> None:
+    """Register the Nuki lock entity services on the current platform."""
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(SERVICE_UNLATCH, {}, "async_unlatch")
+    platform.async_register_entity_service(SERVICE_LOCK_N_GO, {}, "async_lock_n_go")
 
 
 # Legacy YAML platform setup (for backward compatibility)
@@ -162,6 +204,9 @@ async def async_setup_platform(
         _LOGGER.error("Unable to retrieve smartlocks from Nuki API: %s", ex)
         return
     
+    coordinator = NukiCoordinator(hass, nuki_api, scan_interval)
+    coordinator.async_set_updated_data(smartlocks_by_id(smartlocks))
+    
     # Create lock entities
     entities = []
     for smartlock in smartlocks:
@@ -169,11 +214,11 @@ async def async_setup_platform(
                     smartlock.get('name', 'Unknown'), 
                     smartlock.get('smartlockId', 'Unknown'))
         lock = NukiLock(
+            coordinator=coordinator,
             api=nuki_api, 
             smartlock_data=smartlock, 
             config_entry=None,  # Legacy setup
             name=name,
-            scan_interval=scan_interval, 
             fingerprint_users=fingerprint_users, 
             detection_window=detection_window, 
             enhanced_logging=enhanced_logging
@@ -181,18 +226,67 @@ async def async_setup_platform(
         entities.append(lock)
     
     if entities:
-        async_add_entities(entities, True)
+        async_add_entities(entities)
         _LOGGER.info("Successfully set up %d Nuki lock(s)", len(entities))
+        _async_register_entity_services()
     else:
         _LOGGER.error("No valid Nuki locks could be set up")
 
 
+class NukiApiError(Exception):
+    """Raised when a Nuki Web API request fails."""
+
+
+class NukiAuthError(NukiApiError):
+    """Raised when the Nuki Web API rejects the API token."""
+
+
+class NukiConnectionError(NukiApiError):
+    """Raised when the Nuki Web API can't be reached."""
+
+
+class NukiUnavailableError(NukiApiError):
+    """Raised when an endpoint is missing or forbidden for the API token."""
+
+
+# Error status -> (exception class, message)
+_STATUS_ERRORS = {
+    401: (NukiAuthError, "Invalid API token - check your Nuki Web API token"),
+    403: (NukiUnavailableError, "API access forbidden - check token permissions"),
+    404: (NukiUnavailableError, "API endpoint not found: {endpoint}"),
+}
+
+
 class NukiAPI:
     """Class to communicate with Nuki API."""
     
-    def __init__(self, session: aiohttp.ClientSession, api_key: str):
+    __slots__ = (
+        "_session",
+        "_owns_session",
+        "_timeout",
+        "_max_attempts",
+        "_api_key",
+        "_headers",
+        "_base_url",
+        "_semaphore",
+        "_logs_cache",
+        "_smartlocks_cache",
+        "_full_data_inflight",
+    )
+    
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        api_key: str,
+        owns_session: bool = False,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        max_attempts: int = API_MAX_ATTEMPTS,
+    ):
         """Initialize the API."""
         self._session = session
+        self._owns_session = owns_session
+        self._timeout = timeout or aiohttp.ClientTimeout(total=API_REQUEST_TIMEOUT)
+        self._max_attempts = max_attempts
         self._api_key = api_key
         self._headers = {
             "Authorization": f"Bearer {api_key}",
@@ -200,19 +294,65 @@ class NukiAPI:
             "Accept": "application/json"
         }
         self._base_url = NUKI_API_BASE
+        # Cap concurrent requests to the Nuki cloud to avoid rate limiting
+        self._semaphore = asyncio.Semaphore(API_MAX_CONCURRENCY)
+        # (smartlock_id, limit) -> (expiry, logs)
+        self._logs_cache: Dict[tuple, tuple] = {}
+        # (expiry, smartlocks) of the last smartlock list request
+        self._smartlocks_cache: Optional[tuple] = None
+        # smartlock_id -> pending full data request shared by concurrent callers
+        self._full_data_inflight: Dict[int, asyncio.Future] = {}
+    
+    async def close(self) -> None:
+        """Close the HTTP session if it was created for this API client."""
+        if self._owns_session and not self._session.closed:
+            await self._session.close()
     
     async def update_smartlock_advanced_config(self, smartlock_id: int, config: Dict) -> Dict:
         """Update smartlock advanced configuration."""
         endpoint = f"/smartlock/{smartlock_id}/advanced/config"
-        return await self._request("POST", endpoint, config)
+        result = await self._request("POST", endpoint, config)
+        self._smartlocks_cache = None
+        return result
 
     async def update_smartlock_config(self, smartlock_id: int, config: Dict) -> Dict:
         """Update smartlock configuration."""
         endpoint = f"/smartlock/{smartlock_id}/config"
-        return await self._request("POST", endpoint, config)
+        result = await self._request("POST", endpoint, config)
+        self._smartlocks_cache = None
+        return result
         
     async def get_smartlock_full_data(self, smartlock_id: int) -> Dict:
         """Get complete smartlock data including config and advanced config."""
+        # Join a request for the same smartlock that is already in flight
+        while (pending := self._full_data_inflight.get(smartlock_id)) is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # Only the leading caller was cancelled: fetch again instead of failing too
+                if not pending.cancelled() or asyncio.current_task().cancelling():
+                    raise
+        
+        future = asyncio.get_running_loop().create_future()
+        self._full_data_inflight[smartlock_id] = future
+        try:
+            result = await self._fetch_smartlock_full_data(smartlock_id)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as ex:
+            future.set_exception(ex)
+            # Mark as retrieved so an unawaited failure isn't logged by asyncio
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._full_data_inflight[smartlock_id]
+    
+    async def _fetch_smartlock_full_data(self, smartlock_id: int) -> Dict:
+        """Fetch complete smartlock data from the API."""
         try:
             # Get the full smartlock list which includes all config data
             smartlocks = await self.get_smartlocks()
@@ -231,48 +371,68 @@ class NukiAPI:
             # Fall back to individual endpoint
             return await self.get_smartlock_state(smartlock_id)
 
-    async def _request(self, method: str, endpoint: str, data: Dict = None) -> Dict:
-        """Make API request."""
+    async def _request(self, method: str, endpoint: str, data: Dict = None, params: Dict = None) -> Dict:
+        """Make API request, retrying with backoff on rate limits and failed reads."""
         url = f"{self._base_url}{endpoint}"
         
         _LOGGER.debug("Making %s request to %s", method, url)
         if data:
             _LOGGER.debug("Request data: %s", data)
         
-        try:
-            async with async_timeout.timeout(15):
-                async with self._session.request(
-                    method, url, headers=self._headers, json=data
-                ) as response:
-                    _LOGGER.debug("API Response: %s %s", response.status, response.reason)
-                    
-                    if response.status == 401:
-                        raise Exception("Invalid API token - check your Nuki Web API token")
-                    elif response.status == 403:
-                        raise Exception("API access forbidden - check token permissions")
-                    elif response.status == 404:
-                        raise Exception(f"API endpoint not found: {endpoint}")
-                    elif response.status >= 400:
-                        error_text = await response.text()
-                        raise Exception(f"API error {response.status}: {error_text}")
-                    
-                    response.raise_for_status()
-                    
-                    # Handle empty responses
-                    content_type = response.headers.get('content-type', '')
-                    if 'application/json' in content_type:
-                        result = await response.json()
-                        _LOGGER.debug("API Response data: %s", result)
-                        return result
-                    else:
-                        text_result = await response.text()
-                        _LOGGER.debug("API Response text: %s", text_result)
-                        return {"message": text_result}
+        retry_delay = 0
+        max_attempts = self._max_attempts
+        for attempt in range(max_attempts):
+            # Back off outside the semaphore so waiting requests don't block others
+            if retry_delay:
+                await asyncio.sleep(retry_delay)
+            
+            try:
+                async with self._semaphore:
+                    async with self._session.request(
+                        method, url, headers=self._headers, json=data, params=params,
+                        timeout=self._timeout
+                    ) as response:
+                        _LOGGER.debug("API Response: %s %s", response.status, response.reason)
+                        
+                        # A 5xx on a command may come after the lock already acted, so only reads are retried then
+                        if (attempt < max_attempts - 1 and
+                                (response.status == 429 or (response.status >= 500 and method == "GET"))):
+                            retry_delay = self._get_retry_delay(response, attempt)
+                            _LOGGER.debug("API returned %s, retrying in %.1f seconds", 
+                                        response.status, retry_delay)
+                            continue
+                        
+                        if response.status >= 400:
+                            error = _STATUS_ERRORS.get(response.status)
+                            if error is not None:
+                                error_class, message = error
+                                raise error_class(message.format(endpoint=endpoint))
+                            error_text = await response.text()
+                            raise NukiApiError(f"API error {response.status}: {error_text}")
+                        
+                        # Handle empty responses
+                        content_type = response.headers.get('content-type', '')
+                        if 'application/json' in content_type:
+                            result = await response.json(loads=json_loads)
+                            _LOGGER.debug("API Response data: %s", result)
+                            return result
+                        else:
+                            text_result = await response.text()
+                            _LOGGER.debug("API Response text: %s", text_result)
+                            return {"message": text_result}
                     
-        except asyncio.TimeoutError:
-            raise Exception("Timeout connecting to Nuki API")
-        except aiohttp.ClientError as ex:
-            raise Exception(f"Error connecting to Nuki API: {ex}")
+            except asyncio.TimeoutError:
+                raise NukiConnectionError("Timeout connecting to Nuki API")
+            except aiohttp.ClientError as ex:
+                raise NukiConnectionError(f"Error connecting to Nuki API: {ex}")
+    
+    @staticmethod
+    def _get_retry_delay(response: aiohttp.ClientResponse, attempt: int) -> float:
+        """Return seconds to wait before retrying, honoring Retry-After when present."""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return min(int(retry_after), API_MAX_RETRY_DELAY)
+        return min(2 ** attempt, API_MAX_RETRY_DELAY) + random.random()
     
     async def test_connection(self) -> bool:
         """Test API connection."""
@@ -285,24 +445,32 @@ class NukiAPI:
     
     async def get_smartlocks(self) -> list:
         """Get list of smartlocks."""
+        cached = self._smartlocks_cache
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        
         try:
             _LOGGER.debug("Getting smartlocks from API...")
             result = await self._request("GET", "/smartlock")
             
             # Handle different response formats
             if isinstance(result, list):
-                return result
+                smartlocks = result
             elif isinstance(result, dict) and 'smartlocks' in result:
-                return result['smartlocks']
+                smartlocks = result['smartlocks']
             elif isinstance(result, dict):
                 # Single smartlock returned as dict
-                return [result]
+                smartlocks = [result]
             else:
                 _LOGGER.warning("Unexpected API response format: %s", type(result))
                 return []
             
+            self._smartlocks_cache = (time.monotonic() + SMARTLOCKS_CACHE_TTL, smartlocks)
+            return smartlocks
+            
         except Exception as ex:
-            _LOGGER.error("Failed to get smartlocks: %s", ex)
+            # Callers report the failure (the coordinator logs it once per outage)
+            _LOGGER.debug("Failed to get smartlocks: %s", ex)
             raise
     
     async def get_smartlock_state(self, smartlock_id: int) -> Dict:
@@ -314,39 +482,39 @@ class NukiAPI:
         """Send action to smartlock."""
         endpoint = f"/smartlock/{smartlock_id}/action"
         data = {"action": action}
-        return await self._request("POST", endpoint, data)
+        result = await self._request("POST", endpoint, data)
+        self._smartlocks_cache = None
+        self._invalidate_logs_cache(smartlock_id)
+        return result
+    
+    def _invalidate_logs_cache(self, smartlock_id: int) -> None:
+        """Drop cached activity logs for a smartlock."""
+        for key in [key for key in self._logs_cache if key[0] == smartlock_id]:
+            del self._logs_cache[key]
     
     async def get_smartlock_logs(self, smartlock_id: int, limit: int = 50) -> list:
         """Get smartlock activity logs."""
+        cache_key = (smartlock_id, limit)
+        cached = self._logs_cache.get(cache_key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        
         endpoint = f"/smartlock/{smartlock_id}/log"
         
         try:
-            # Try with query parameters
-            url = f"{self._base_url}{endpoint}?limit={limit}"
-            
-            async with async_timeout.timeout(15):
-                async with self._session.get(
-                    url, headers=self._headers
-                ) as response:
-                    if response.status == 404:
-                        _LOGGER.warning("Log endpoint not available for smartlock %s", smartlock_id)
-                        return []
-                    elif response.status == 403:
-                        _LOGGER.warning("Access to logs forbidden for smartlock %s", smartlock_id)
-                        return []
-                    
-                    response.raise_for_status()
-                    
-                    content_type = response.headers.get('content-type', '')
-                    if 'application/json' in content_type:
-                        result = await response.json()
-                        return result if isinstance(result, list) else []
-                    else:
-                        return []
-                    
+            result = await self._request("GET", endpoint, params={"limit": limit})
+        except NukiUnavailableError as ex:
+            _LOGGER.warning("Logs not available for smartlock %s: %s", smartlock_id, ex)
+            return []
         except Exception as ex:
             _LOGGER.error("Error getting smartlock logs: %s", ex)
             return []
+        
+        # Non-JSON responses come back as a message dict
+        if not isinstance(result, list):
+            return []
+        self._logs_cache[cache_key] = (time.monotonic() + LOGS_CACHE_TTL, result)
+        return result
     
     async def get_smartlock_auth(self, smartlock_id: int) -> list:
         """Get smartlock auth entries (including keypads)."""
@@ -372,25 +540,28 @@ class NukiAPI:
             return []
 
 
-class NukiLock(LockEntity):
+class NukiLock(CoordinatorEntity, LockEntity):
     """Representation of a Nuki Smart Lock."""
     
     def __init__(
         self, 
+        coordinator: NukiCoordinator,
         api: NukiAPI, 
         smartlock_data: Dict, 
         config_entry: ConfigEntry = None,
         name: str = None,
-        scan_interval: timedelta = None, 
         fingerprint_users: Dict = None, 
         detection_window: int = DEFAULT_DETECTION_WINDOW, 
         enhanced_logging: bool = False
     ):
         """Initialize the lock."""
+        super().__init__(coordinator)
         self._api = api
         self._smartlock_id = smartlock_data["smartlockId"]
         self._smartlock_name = smartlock_data.get('name', 'Unknown Lock')
+        self._attr_device_info = device_info(self._smartlock_id, self._smartlock_name)
         self._config_entry = config_entry
+        self._attr_unique_id = f"nuki_{self._smartlock_id}"
         
         # Name handling for both config flow and legacy YAML
         if config_entry:
@@ -402,22 +573,38 @@ class NukiLock(LockEntity):
             self._name = f"{name} {self._smartlock_name}" if name else self._smartlock_name
             self._attr_name = self._name
         
-        self._scan_interval = scan_interval or DEFAULT_SCAN_INTERVAL
-        
         # Configurable fingerprint user mapping
         self._fingerprint_users = fingerprint_users or {}
+        # Source number -> configured user, skipping unset "source_N" entries
+        self._fingerprint_source_map = {
+            int(key.removeprefix("source_")): user
+            for key, user in self._fingerprint_users.items()
+            if user and key.removeprefix("source_").isdigit()
+        }
         self._detection_window = detection_window
         self._enhanced_logging = enhanced_logging
         
         # State attributes
         self._state = None
-        self._available = True
         self._battery_critical = False
         self._battery_level = None
         self._last_keypad_action = None
+        self._last_keypad_action_time: Optional[datetime] = None
         self._last_keypad_user = None
         self._last_update = None
         self._last_manual_action = None
+        # Newest log entry the keypad check has already looked at
+        self._last_seen_log_id = None
+        
+        # Adaptive activity log polling
+        self._quiet_log_checks = 0
+        self._polls_until_log_check = 0
+        
+        # Coordinator-driven values of the last state write
+        self._written_snapshot: Optional[tuple] = None
+        
+        # Kept up to date by _update_extra_state_attributes rather than built on every read
+        self._attr_extra_state_attributes = {"smartlock_id": self._smartlock_id}
         
         # Store initial data
         self._update_from_data(smartlock_data)
@@ -425,41 +612,21 @@ class NukiLock(LockEntity):
         if self._enhanced_logging:
             _LOGGER.info("Nuki lock initialized with fingerprint users: %s", self._fingerprint_users)
     
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, str(self._smartlock_id))},
-            name=self._smartlock_name,
-            manufacturer="Nuki",
-            model="Smart Lock Ultra" if "Ultra" in self._smartlock_name else "Smart Lock",
-            sw_version=None,
-            via_device=None,
-        )
-    
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID."""
-        return f"nuki_{self._smartlock_id}"
-    
     @property
     def available(self) -> bool:
-        """Return True if entity is available."""
-        return self._available
+        """Return if the smartlock is still reported by the API."""
+        return super().available and self._smartlock_id in self.coordinator.data
     
     @property
     def is_locked(self) -> bool:
         """Return True if the lock is locked."""
         return self._state == LockState.LOCKED
     
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return additional state attributes."""
-        attrs = {
-            "smartlock_id": self._smartlock_id,
-            "battery_critical": self._battery_critical,
-            "last_update": self._last_update,
-        }
+    def _update_extra_state_attributes(self) -> None:
+        """Update the additional state attributes from the current values."""
+        attrs = self._attr_extra_state_attributes
+        attrs["battery_critical"] = self._battery_critical
+        attrs["last_update"] = self._last_update.isoformat() if self._last_update else None
         
         if self._battery_level is not None:
             attrs["battery_level"] = self._battery_level
@@ -467,8 +634,6 @@ class NukiLock(LockEntity):
         if self._last_keypad_action:
             attrs["last_keypad_action"] = self._last_keypad_action
             attrs["last_keypad_user"] = self._last_keypad_user
-        
-        return attrs
     
     async def async_lock(self, **kwargs: Any) -> None:
         """Lock the device."""
@@ -504,58 +669,96 @@ class NukiLock(LockEntity):
     
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
-        # Set up periodic updates using the correct method name
-        async_track_time_interval(self.hass, self._async_update_wrapper, self._scan_interval)
+        await super().async_added_to_hass()
         
-        # Initial update
-        await self.async_update()
+        # Initial activity check, without holding up entity setup on the log request
+        self.hass.async_create_task(self._async_check_activity(), eager_start=True)
     
-    async def _async_update_wrapper(self, now) -> None:
-        """Wrapper for the update method to work with async_track_time_interval."""
-        await self.async_update()
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        available = self.available
+        previous_state = self._state
+        if available:
+            self._update_from_data(self.coordinator.data[self._smartlock_id])
+        
+        # Skip the state write when none of the polled values changed
+        snapshot = (available, self._state, self._battery_critical, self._battery_level)
+        if snapshot != self._written_snapshot:
+            self._written_snapshot = snapshot
+            super()._handle_coordinator_update()
+        
+        if not available:
+            # The coordinator already logged the failure; skip the activity log requests too
+            return
+        
+        # A state change usually means a keypad or manual action, so read the log right away
+        if self._state != previous_state:
+            self._quiet_log_checks = 0
+            self._polls_until_log_check = 0
+        
+        if self._polls_until_log_check > 0:
+            self._polls_until_log_check -= 1
+            return
+        self._polls_until_log_check = self._log_check_skip()
+        self.hass.async_create_task(self._async_check_activity(), eager_start=True)
     
-    async def async_update(self) -> None:
-        """Update the lock state."""
-        try:
-            # Get current state
-            data = await self._api.get_smartlock_state(self._smartlock_id)
-            self._update_from_data(data)
-            
-            # Check for keypad actions
-            await self._check_keypad_actions()
-            
-            # Check for manual actions
-            await self._check_manual_actions()
-            
-            self._available = True
-            self._last_update = datetime.now().isoformat()
-            
-        except Exception as ex:
-            _LOGGER.error("Error updating %s: %s", self._name, ex)
-            self._available = False
+    def _log_check_skip(self) -> int:
+        """Return how many polls to skip before the next activity log check."""
+        skip = min(LOG_CHECK_MAX_SKIP, self._quiet_log_checks // 2)
+        # Keep checks at most (window - one poll) apart, so an event logged right after
+        # a check is still inside the detection window, with latency to spare, at the next one
+        interval = self.coordinator.update_interval.total_seconds()
+        return max(0, min(skip, int(self._detection_window // interval) - 2))
+    
+    async def _async_check_activity(self) -> None:
+        """Check the activity log for keypad and manual actions."""
+        # One log request serves both checks
+        logs = await self._api.get_smartlock_logs(self._smartlock_id, limit=20)
+        
+        # Back off while the newest log entry stays the same
+        if logs and logs[0].get("id") == self._last_seen_log_id:
+            self._quiet_log_checks += 1
+        else:
+            self._quiet_log_checks = 0
+        
+        # Check for keypad actions
+        await self._check_keypad_actions(logs)
+        
+        # Check for manual actions, which only looked at the 10 most recent entries
+        await self._check_manual_actions(logs[:10])
+        
+        self._last_update = dt_util.utcnow()
+        self._update_extra_state_attributes()
+        self.async_write_ha_state()
     
     def _update_from_data(self, data: Dict) -> None:
         """Update entity from API data."""
-        if "state" in data:
-            state_id = data["state"]["state"]
-            self._state = NUKI_STATES.get(state_id, "unknown")
-        
-        if "state" in data and "batteryCritical" in data["state"]:
-            self._battery_critical = data["state"]["batteryCritical"]
+        state = data.get("state")
+        if state is not None:
+            state_id = state.get("state")
+            if isinstance(state_id, int) and 0 <= state_id < len(NUKI_STATES):
+                self._state = NUKI_STATES[state_id]
+            else:
+                self._state = "unknown"
+            
+            if "batteryCritical" in state:
+                self._battery_critical = state["batteryCritical"]
         
         # Extract battery level if available
-        if "config" in data and "batteryLevel" in data["config"]:
-            self._battery_level = data["config"]["batteryLevel"]
+        config = data.get("config")
+        if config is not None and "batteryLevel" in config:
+            self._battery_level = config["batteryLevel"]
+        
+        self._update_extra_state_attributes()
     
-    async def _check_keypad_actions(self) -> None:
+    async def _check_keypad_actions(self, logs: list) -> None:
         """Check for recent keypad actions and trigger events."""
+        # Evaluated once so disabled debug output costs nothing per log entry
+        debug_logging = self._enhanced_logging and _LOGGER.isEnabledFor(logging.DEBUG)
         try:
-            if self._enhanced_logging:
+            if debug_logging:
                 _LOGGER.debug("=== Starting keypad action check for %s ===", self._name)
-            
-            # Get logs from API
-            logs = await self._api.get_smartlock_logs(self._smartlock_id, limit=20)
-            if self._enhanced_logging:
                 _LOGGER.debug("Retrieved %d log entries from API", len(logs))
             
             if not logs:
@@ -564,7 +767,7 @@ class NukiLock(LockEntity):
             
             # Get current time in UTC for proper comparison
             current_time_utc = datetime.now(timezone.utc)
-            if self._enhanced_logging:
+            if debug_logging:
                 _LOGGER.debug("Current time (UTC): %s", current_time_utc)
                 _LOGGER.debug("Last processed keypad action: %s", self._last_keypad_action)
                 _LOGGER.debug("Detection window: %d seconds", self._detection_window)
@@ -572,74 +775,103 @@ class NukiLock(LockEntity):
             # Collect ALL recent keypad actions within time window
             recent_keypad_actions = []
             
+            detection_window = self._detection_window
+            last_seen_log_id = self._last_seen_log_id
+            last_keypad_action_time = self._last_keypad_action_time
+            # Index of the oldest entry that couldn't be evaluated yet
+            oldest_skipped = None
+            
             # Check each log entry
             for i, log_entry in enumerate(logs):
                 try:
-                    # Extract basic info
-                    trigger = log_entry.get("trigger")
-                    action = log_entry.get("action")
+                    # Everything from here on was handled by an earlier check
+                    if last_seen_log_id is not None and log_entry.get("id") == last_seen_log_id:
+                        if debug_logging:
+                            _LOGGER.debug("Entry %d was already checked, skipping the rest", i)
+                        break
+                    
                     log_date = log_entry.get("date", "")
-                    user_name = log_entry.get("name", "Unknown")
-                    source = log_entry.get("source")
-                    auth_id = log_entry.get("authId", "")
-                    state = log_entry.get("state", 0)
                     
-                    if self._enhanced_logging:
+                    # Parse timestamp and check time window
+                    try:
+                        log_time_utc = self._parse_timestamp(log_date)
+                    except Exception as time_ex:
+                        _LOGGER.error("Error parsing timestamp '%s': %s", log_date, time_ex)
+                        oldest_skipped = i
+                        continue
+                    time_diff = (current_time_utc - log_time_utc).total_seconds()
+                    
+                    # Logs are newest first, so all remaining entries are older still
+                    if time_diff >= detection_window:
+                        if debug_logging:
+                            _LOGGER.debug("Entry %d is outside the detection window, skipping the rest", i)
+                        break
+                    
+                    # Nothing at or before the last processed keypad action can be new
+                    if last_keypad_action_time is not None and log_time_utc <= last_keypad_action_time:
+                        if debug_logging:
+                            _LOGGER.debug("Entry %d predates the last keypad action, skipping the rest", i)
+                        break
+                    
+                    # Extract basic info
+                    get = log_entry.get
+                    trigger = get("trigger")
+                    action = get("action")
+                    user_name = get("name", "Unknown")
+                    source = get("source")
+                    auth_id = get("authId", "")
+                    
+                    if debug_logging:
                         _LOGGER.debug("Entry %d - Trigger: %s, Action: %s, Date: %s, User: %s, Source: %s", i, trigger, action, log_date, user_name, source)
                     
                     # Detect keypad actions
-                    is_keypad_action = self._is_keypad_action(trigger, user_name, source, auth_id, action)
+                    if not self._is_keypad_action(trigger, user_name, source, auth_id, action):
+                        continue
                     
-                    if is_keypad_action:
-                        detection_reason = self._get_detection_reason(trigger, user_name, source, auth_id, action)
+                    detection_reason = self._get_detection_reason(trigger, user_name, source, auth_id, action)
+                    
+                    if debug_logging:
+                        _LOGGER.debug("Found keypad action: %s by %s at %s (reason: %s)", 
+                                    action, user_name, log_date, detection_reason)
+                        _LOGGER.debug("Time difference: %.1f seconds (%.1f minutes)", time_diff, time_diff/60)
+                    
+                    # Check if not in the future
+                    if time_diff >= 0:
                         
-                        if self._enhanced_logging:
-                            _LOGGER.debug("Found keypad action: %s by %s at %s (reason: %s)", 
-                                        action, user_name, log_date, detection_reason)
+                        # Determine access method and user
+                        access_method, actual_user = self._determine_access_method_and_user(
+                            user_name, logs, i, source, auth_id)
                         
-                        # Parse timestamp and check time window
-                        try:
-                            log_time_utc = self._parse_timestamp(log_date)
-                            time_diff = (current_time_utc - log_time_utc).total_seconds()
-                            
-                            if self._enhanced_logging:
-                                _LOGGER.debug("Time difference: %.1f seconds (%.1f minutes)", time_diff, time_diff/60)
-                            
-                            # Check if within time window and not already processed
-                            if (time_diff < self._detection_window and time_diff >= 0 and 
-                                (self._last_keypad_action is None or log_date > self._last_keypad_action)):
-                                
-                                # Determine access method and user
-                                access_method, actual_user = self._determine_access_method_and_user(
-                                    user_name, logs, i, source, auth_id)
-                                
-                                recent_keypad_actions.append({
-                                    'log_entry': log_entry,
-                                    'log_date': log_date,
-                                    'log_time_utc': log_time_utc,
-                                    'time_diff': time_diff,
-                                    'access_method': access_method,
-                                    'actual_user': actual_user,
-                                    'user_name': user_name,
-                                    'detection_reason': detection_reason,
-                                    'action': action,
-                                    'source': source,
-                                    'auth_id': auth_id,
-                                    'state': state,
-                                    'trigger': trigger
-                                })
-                                
-                        except Exception as time_ex:
-                            _LOGGER.error("Error parsing timestamp '%s': %s", log_date, time_ex)
+                        # Raw fields are read back from the log entry when the event is fired
+                        recent_keypad_actions.append({
+                            'log_entry': log_entry,
+                            'log_time_utc': log_time_utc,
+                            'time_diff': time_diff,
+                            'access_method': access_method,
+                            'actual_user': actual_user,
+                            'detection_reason': detection_reason,
+                        })
+                    else:
+                        # Lock or cloud clock is ahead of ours; look at it again next time
+                        oldest_skipped = i
                             
                 except Exception as entry_ex:
                     _LOGGER.error("Error processing log entry %d: %s", i, entry_ex)
+                    oldest_skipped = i
                     continue
             
+            # Only move the cursor past entries that were actually evaluated
+            if oldest_skipped is None:
+                self._last_seen_log_id = logs[0].get("id")
+            elif oldest_skipped + 1 < len(logs):
+                self._last_seen_log_id = logs[oldest_skipped + 1].get("id")
+            else:
+                self._last_seen_log_id = None
+            
             # Process and fire events for recent actions
             await self._process_recent_actions(recent_keypad_actions)
             
-            if self._enhanced_logging:
+            if debug_logging:
                 _LOGGER.debug("=== Finished keypad action check ===")
             
         except Exception as ex:
@@ -666,13 +898,8 @@ class NukiLock(LockEntity):
 
     def _parse_timestamp(self, log_date: str) -> datetime:
         """Parse log timestamp to UTC datetime."""
-        if log_date.endswith('Z'):
-            return datetime.fromisoformat(log_date.replace("Z", "+00:00"))
-        elif '+' in log_date or log_date.endswith('+00:00'):
-            return datetime.fromisoformat(log_date)
-        else:
-            log_time_naive = datetime.fromisoformat(log_date)
-            return log_time_naive.replace(tzinfo=timezone.utc)
+        # Polls mostly see the same entries again, so parsed dates are cached
+        return _parse_log_timestamp(log_date)
     
     def _determine_access_method_and_user(self, user_name: str, logs: list, index: int, 
                                         source: int, auth_id: str) -> tuple:
@@ -681,52 +908,31 @@ class NukiLock(LockEntity):
         current_entry = logs[index] if index < len(logs) else {}
         state = current_entry.get("state", 0)
         
-        # Based on API docs: source 1 = PIN Code, source 2 = Fingerprint
-        if source == 2:
-            # Check for authentication errors first
-            if state == 225:  # Error wrong fingerprint
-                access_method = "fingerprint"
-                actual_user = "Unknown Fingerprint (Failed)"
-            elif user_name == "Nuki Keypad" and state != 0:
-                # Other error states with Nuki Keypad
-                access_method = "fingerprint"
-                actual_user = f"Unknown Fingerprint (Error {state})"
-            elif user_name and user_name not in ["Nuki Keypad", "Unknown"]:
-                # Successful fingerprint with real user name
-                access_method = "fingerprint"
-                actual_user = user_name
-            else:
-                # Fallback for "Nuki Keypad" with successful state
-                access_method = "fingerprint"
-                actual_user = self._determine_fingerprint_user_fallback(source)
-                
-            if self._enhanced_logging:
-                _LOGGER.info("Detected fingerprint access by %s (source: %s, state: %s)", actual_user, source, state)
-                
-        elif source == 1:
-            # Check for authentication errors first
-            if state == 224:  # Error wrong entry code
-                access_method = "pin_code"
-                actual_user = "Unknown PIN (Failed)"
-            elif user_name == "Nuki Keypad" and state != 0:
-                # Other error states with PIN
-                access_method = "pin_code"
-                actual_user = f"Unknown PIN (Error {state})"
-            elif user_name and user_name not in ["Nuki Keypad", "Unknown"]:
-                # Successful PIN with real user name
-                access_method = "pin_code"
-                actual_user = user_name
-            else:
-                access_method = "pin_code"
-                actual_user = "PIN User"
-                
-            if self._enhanced_logging:
-                _LOGGER.info("Detected PIN code access by %s (source: %s, state: %s)", actual_user, source, state)
-        else:
+        source_info = KEYPAD_SOURCES.get(source)
+        if source_info is None:
             access_method = "unknown"
             actual_user = user_name if user_name else "Unknown User"
-            if self._enhanced_logging:
+            if self._enhanced_logging and _LOGGER.isEnabledFor(logging.INFO):
                 _LOGGER.info("Unknown access method: user=%s, source=%s, state=%s", actual_user, source, state)
+            return access_method, actual_user
+        
+        access_method, failed_state, label, default_user = source_info
+        
+        # Check for authentication errors first
+        if state == failed_state:
+            actual_user = f"Unknown {label} (Failed)"
+        elif user_name == "Nuki Keypad" and state != 0:
+            # Other error states with Nuki Keypad
+            actual_user = f"Unknown {label} (Error {state})"
+        elif user_name and user_name not in ("Nuki Keypad", "Unknown"):
+            # Successful access with real user name
+            actual_user = user_name
+        else:
+            # Fallback for "Nuki Keypad" with successful state
+            actual_user = default_user or self._determine_fingerprint_user_fallback(source)
+        
+        if self._enhanced_logging and _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("Detected %s access by %s (source: %s, state: %s)", label, actual_user, source, state)
         
         return access_method, actual_user
     
@@ -734,9 +940,9 @@ class NukiLock(LockEntity):
         """Fallback method when API returns 'Nuki Keypad' instead of actual user name."""
         try:
             # Use configured source mapping
-            source_key = f"source_{source}"
-            if source_key in self._fingerprint_users and self._fingerprint_users[source_key]:
-                return self._fingerprint_users[source_key]
+            configured_user = self._fingerprint_source_map.get(source)
+            if configured_user:
+                return configured_user
             
             # Fallback
             return f"Fingerprint User (Source {source})"
@@ -752,179 +958,62 @@ class NukiLock(LockEntity):
                 _LOGGER.debug("No new keypad actions found within time window")
             return
         
-        _LOGGER.info("Found %d recent keypad actions to process", len(recent_keypad_actions))
+        total_events = len(recent_keypad_actions)
+        _LOGGER.info("Found %d recent keypad actions to process", total_events)
+        
+        # Collected in API order, which is newest first, so no sort is needed
         
-        # Sort by timestamp (newest first)
-        recent_keypad_actions.sort(key=lambda x: x['log_time_utc'], reverse=True)
+        # Per-event detail is only worth formatting for enhanced logging
+        verbose = self._enhanced_logging and _LOGGER.isEnabledFor(logging.INFO)
         
         for idx, action_data in enumerate(recent_keypad_actions):
-            if self._enhanced_logging:
+            log_entry = action_data['log_entry']
+            get = log_entry.get
+            
+            if verbose:
                 _LOGGER.info("Processing keypad action %d/%d: %s by %s via %s (%.1fs ago)", 
-                           idx + 1, len(recent_keypad_actions),
-                           action_data['action'], action_data['actual_user'], 
+                           idx + 1, total_events,
+                           get("action"), action_data['actual_user'], 
                            action_data['access_method'], action_data['time_diff'])
             
             # Create event data
             event_data = {
                 "entity_id": self.entity_id,
                 "smartlock_id": self._smartlock_id,
-                "action": action_data['action'],
+                "action": get("action"),
                 "user": action_data['actual_user'],
-                "original_user_name": action_data['user_name'],
+                "original_user_name": get("name", "Unknown"),
                 "access_method": action_data['access_method'],
-                "timestamp": action_data['log_date'],
+                "timestamp": get("date", ""),
                 "time_diff_seconds": action_data['time_diff'],
-                "trigger_type": action_data['trigger'],
-                "source": action_data['source'],
-                "auth_id": action_data['auth_id'],
-                "state": action_data['state'],
+                "trigger_type": get("trigger"),
+                "source": get("source"),
+                "auth_id": get("authId", ""),
+                "state": get("state", 0),
                 "detection_reason": action_data['detection_reason'],
                 "sequence_number": idx + 1,
-                "total_events": len(recent_keypad_actions),
-                "raw_entry": action_data['log_entry']
+                "total_events": total_events,
+                "raw_entry": log_entry
             }
             
-            _LOGGER.info("Firing nuki_keypad_action event %d/%d for %s via %s", 
-                       idx + 1, len(recent_keypad_actions),
-                       action_data['actual_user'], action_data['access_method'])
+            if verbose:
+                _LOGGER.info("Firing nuki_keypad_action event %d/%d for %s via %s", 
+                           idx + 1, total_events,
+                           action_data['actual_user'], action_data['access_method'])
             
-            # Fire the event
+            # Fire the event; the bus queues listeners in order, so no pacing is needed
             self.hass.bus.async_fire(EVENT_KEYPAD_ACTION, event_data)
-            
-            # Small delay between events
-            if idx < len(recent_keypad_actions) - 1:
-                await asyncio.sleep(0.1)
         
         # Update tracking
         most_recent = recent_keypad_actions[0]
-        self._last_keypad_action = most_recent['log_date']
+        self._last_keypad_action = most_recent['log_entry'].get("date", "")
+        self._last_keypad_action_time = most_recent['log_time_utc']
         self._last_keypad_user = most_recent['actual_user']
         
         if self._enhanced_logging:
             _LOGGER.debug("Updated last processed keypad action to: %s by %s", 
                          self._last_keypad_action, self._last_keypad_user)
 
-    def _determine_fingerprint_user(self, logs: list, current_index: int, source: int, auth_id: str) -> str:
-        """
-        Determine the actual user for fingerprint access using configurable mappings.
-        """
-        try:
-            if self._enhanced_logging:
-                _LOGGER.debug("Determining fingerprint user for auth_id: %s, source: %s", auth_id[-8:] if auth_id else "None", source)
-            
-            # Method 1: Look for a recent PIN entry by the same auth_id (MOST RELIABLE)
-            auth_id_window = min(20, len(logs))  # Look at more entries for auth_id matching
-            for i in range(max(0, current_index - auth_id_window), min(len(logs), current_index + 5)):
-                if i == current_index:
-                    continue
-                    
-                entry = logs[i]
-                entry_auth_id = entry.get("authId", "")
-                entry_name = entry.get("name", "")
-                entry_source = entry.get("source", 0)
-                entry_trigger = entry.get("trigger", 0)
-                entry_date = entry.get("date", "")
-                
-                # Look for PIN entries (source 1) with same auth_id
-                if (entry_auth_id and entry_auth_id == auth_id and 
-                    entry_source == 1 and entry_trigger == 255 and  # PIN code entry
-                    entry_name and entry_name != "Unknown" and "Nuki Web" not in entry_name):
-                    
-                    if self._enhanced_logging:
-                        _LOGGER.debug("Found fingerprint user via auth_id match: %s (from PIN entry: %s)", entry_name, entry_date)
-                    return entry_name
-            
-            # Method 2: Use configured source mapping
-            source_key = f"source_{source}"
-            if source_key in self._fingerprint_users and self._fingerprint_users[source_key]:
-                configured_user = self._fingerprint_users[source_key]
-                if self._enhanced_logging:
-                    _LOGGER.debug("Found fingerprint user via configured mapping: %s for source %s", configured_user, source)
-                return configured_user
-            
-            # Method 3: Dynamic source mapping based on recent activity
-            source_activity = self._analyze_recent_source_activity(logs, source)
-            if source_activity:
-                if self._enhanced_logging:
-                    _LOGGER.debug("Found fingerprint user via recent activity analysis: %s", source_activity)
-                return source_activity
-            
-            # Method 4: Look at the most frequent recent user (fallback)
-            frequent_user = self._get_most_frequent_recent_user(logs)
-            if frequent_user:
-                if self._enhanced_logging:
-                    _LOGGER.debug("Found fingerprint user via frequency analysis: %s", frequent_user)
-                return frequent_user
-            
-            # Fallback: Return descriptive name
-            fallback_name = f"Fingerprint User (Source {source})"
-            if auth_id and len(auth_id) > 8:
-                fallback_name += f" [{auth_id[-8:]}]"
-            
-            if self._enhanced_logging:
-                _LOGGER.debug("Using fallback fingerprint user: %s", fallback_name)
-            return fallback_name
-            
-        except Exception as ex:
-            _LOGGER.error("Error determining fingerprint user: %s", ex)
-            return "Unknown Fingerprint User"
-
-    def _analyze_recent_source_activity(self, logs: list, target_source: int) -> str:
-        """Analyze recent activity to determine likely user for a source."""
-        try:
-            # Look at recent PIN entries (source 1) from keypad actions
-            recent_entries = logs[:15]  # Last 15 entries
-            source_users = []
-            
-            for entry in recent_entries:
-                entry_source = entry.get("source", 0)
-                entry_name = entry.get("name", "")
-                entry_trigger = entry.get("trigger", 0)
-                
-                # Look for PIN codes (source 1) from keypad (trigger 255)
-                if (entry_trigger == 255 and entry_source == 1 and  # PIN code entry
-                    entry_name and entry_name != "Unknown" and "Nuki Web" not in entry_name):
-                    source_users.append(entry_name)
-            
-            if source_users:
-                # Return the most recent user for PIN codes
-                return source_users[0]
-                
-        except Exception as ex:
-            if self._enhanced_logging:
-                _LOGGER.debug("Error in source activity analysis: %s", ex)
-        
-        return None
-
-    def _get_most_frequent_recent_user(self, logs: list) -> str:
-        """Get the most frequent recent user as a last resort."""
-        try:
-            recent_users = []
-            recent_entries = logs[:20]  # Last 20 entries
-            
-            for entry in recent_entries:
-                user = entry.get("name", "")
-                trigger = entry.get("trigger", 0)
-                source = entry.get("source", 0)
-                
-                # Only consider keypad PIN entries
-                if (trigger == 255 and source == 1 and  # PIN code entry
-                    user and user != "Unknown" and "Nuki Web" not in user):
-                    recent_users.append(user)
-            
-            if recent_users:
-                # Count frequency and return most common
-                from collections import Counter
-                user_counts = Counter(recent_users)
-                most_frequent = user_counts.most_common(1)[0][0]
-                return most_frequent
-                
-        except Exception as ex:
-            if self._enhanced_logging:
-                _LOGGER.debug("Error in frequency analysis: %s", ex)
-        
-        return None
-
     async def debug_recent_logs(self) -> None:
         """Debug method to show recent logs."""
         try:
@@ -943,52 +1032,59 @@ class NukiLock(LockEntity):
         except Exception as ex:
             _LOGGER.error("Error in debug_recent_logs: %s", ex)
 
-    async def _check_manual_actions(self) -> None:
+    async def _check_manual_actions(self, logs: list) -> None:
         """Check for manual (non-keypad) actions and fire events."""
         try:
-            logs = await self._api.get_smartlock_logs(self._smartlock_id, limit=10)
             current_time_utc = datetime.now(timezone.utc)
             
+            detection_window = self._detection_window
+            last_manual_action = self._last_manual_action
+            
+            # Logs are newest first, so the first new manual trigger in the window is the one to fire
             for log_entry in logs:
-                trigger = log_entry.get("trigger")
-                action = log_entry.get("action")
+                if log_entry.get("trigger") != 1:  # Manual trigger
+                    continue
+                
                 log_date = log_entry.get("date", "")
-                user_name = log_entry.get("name", "")
+                try:
+                    log_time_utc = self._parse_timestamp(log_date)
+                except Exception as ex:
+                    _LOGGER.error("Error processing manual action: %s", ex)
+                    continue
+                time_diff = (current_time_utc - log_time_utc).total_seconds()
                 
-                # Detect manual operations (inside handle or external key)
-                if trigger == 1:  # Manual trigger
-                    try:
-                        log_time_utc = self._parse_timestamp(log_date)
-                        time_diff = (current_time_utc - log_time_utc).total_seconds()
-                        
-                        # Check if within detection window and not processed
-                        if (time_diff < self._detection_window and time_diff >= 0 and 
-                            (self._last_manual_action is None or log_date > self._last_manual_action)):
-                            
-                            # Determine if inside handle or external key based on action and context
-                            manual_type = self._determine_manual_type(log_entry, logs)
-                            
-                            # Fire manual action event
-                            event_data = {
-                                "entity_id": self.entity_id,
-                                "smartlock_id": self._smartlock_id,
-                                "action": action,
-                                "manual_type": manual_type,  # "inside_handle", "external_key", or "unknown"
-                                "timestamp": log_date,
-                                "time_diff_seconds": time_diff,
-                                "trigger_type": trigger,
-                                "user_name": user_name,
-                                "raw_entry": log_entry
-                            }
-                            
-                            _LOGGER.info("Manual action detected: %s via %s", action, manual_type)
-                            self.hass.bus.async_fire(EVENT_MANUAL_ACTION, event_data)
-                            
-                            self._last_manual_action = log_date
-                            break
-                            
-                    except Exception as ex:
-                        _LOGGER.error("Error processing manual action: %s", ex)
+                # Lock or cloud clock is ahead of ours; a later check picks it up
+                if time_diff < 0:
+                    continue
+                
+                # Older entries are outside the window or already processed as well
+                if time_diff >= detection_window or (
+                        last_manual_action is not None and log_date <= last_manual_action):
+                    return
+                
+                action = log_entry.get("action")
+                
+                # Determine if inside handle or external key based on action and context
+                manual_type = self._determine_manual_type(log_entry, logs)
+                
+                # Fire manual action event
+                event_data = {
+                    "entity_id": self.entity_id,
+                    "smartlock_id": self._smartlock_id,
+                    "action": action,
+                    "manual_type": manual_type,  # "inside_handle", "external_key", or "unknown"
+                    "timestamp": log_date,
+                    "time_diff_seconds": time_diff,
+                    "trigger_type": 1,
+                    "user_name": log_entry.get("name", ""),
+                    "raw_entry": log_entry
+                }
+                
+                _LOGGER.info("Manual action detected: %s via %s", action, manual_type)
+                self.hass.bus.async_fire(EVENT_MANUAL_ACTION, event_data)
+                
+                self._last_manual_action = log_date
+                return
                         
         except Exception as ex:
             _LOGGER.error("Error checking manual actions: %s", ex)
@@ -999,22 +1095,12 @@ class NukiLock(LockEntity):
         This is based on analysis of the action type and context.
         """
         action = log_entry.get("action")
-        state = log_entry.get("state", 0)
         
         # Heuristic approach - may need refinement based on your specific lock model
         if action == 1:  # Unlock action
             # If unlock action is manual, likely external key or inside handle
             # External key typically shows as unlock without specific user
             # Inside handle might show differently based on door configuration
-            if log_entry.get("name") == "":
-                return "external_key"
-            else:
-                return "inside_handle"
-        elif action == 2:  # Lock action
-            # Manual lock actions are typically from inside
-            return "inside_handle"
-        elif action == 3:  # Unlatch action
-            # Manual unlatch typically from inside handle
-            return "inside_handle"
-        else:
-            return "unknown"
\ No newline at end of file
+            return "external_key" if log_entry.get("name") == "" else "inside_handle"
+        
+        return MANUAL_ACTION_TYPES.get(action, "unknown")
\ No newline at end of file
@@ -3,16 +3,16 @@ Nuki Smart Lock Number Platform
 Provides number entities for configurable numeric settings
 """
 import logging
-from datetime import datetime
 from typing import Any, Dict, Optional
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
+from .coordinator import device_info
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -98,7 +98,9 @@ class NukiConfigNumberBase(NumberEntity):
         self._api = api
         self._smartlock_id = smartlock_id
         self._smartlock_name = smartlock_name
+        self._attr_device_info = device_info(self._smartlock_id, self._smartlock_name)
         self._config_entry = config_entry
+        self._enhanced_logging = config_entry.options.get("enable_enhanced_logging", False)
         self._number_type = number_type
         self._config_key = config_key
         
@@ -118,32 +120,15 @@ class NukiConfigNumberBase(NumberEntity):
         self._attr_available = True
         self._last_update = None
     
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, str(self._smartlock_id))},
-            name=self._smartlock_name,
-            manufacturer="Nuki",
-            model="Smart Lock Ultra" if "Ultra" in self._smartlock_name else "Smart Lock",
-            sw_version=None,
-            via_device=None,
-        )
-    
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return additional state attributes."""
         return {
             "smartlock_id": self._smartlock_id,
             "config_key": self._config_key,
-            "last_update": self._last_update,
+            "last_update": self._last_update.isoformat() if self._last_update else None,
         }
     
-    @property 
-    def _enhanced_logging(self) -> bool:
-        """Check if enhanced logging is enabled."""
-        return self._config_entry.options.get("enable_enhanced_logging", False)
-
     async def async_update(self) -> None:
         """Update the number entity state."""
         try:
@@ -153,7 +138,7 @@ class NukiConfigNumberBase(NumberEntity):
             
             self._attr_native_value = config.get(self._config_key, self._attr_native_min_value)
             self._attr_available = True
-            self._last_update = datetime.now().isoformat()
+            self._last_update = dt_util.utcnow()
             
             if self._enhanced_logging:
                 _LOGGER.debug("Config number %s update: %s = %s", 
@@ -265,7 +250,9 @@ class NukiAdvancedConfigNumberBase(NumberEntity):
         self._api = api
         self._smartlock_id = smartlock_id
         self._smartlock_name = smartlock_name
+        self._attr_device_info = device_info(self._smartlock_id, self._smartlock_name)
         self._config_entry = config_entry
+        self._enhanced_logging = config_entry.options.get("enable_enhanced_logging", False)
         self._number_type = number_type
         self._config_key = config_key
         
@@ -285,33 +272,16 @@ class NukiAdvancedConfigNumberBase(NumberEntity):
         self._attr_available = True
         self._last_update = None
     
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, str(self._smartlock_id))},
-            name=self._smartlock_name,
-            manufacturer="Nuki",
-            model="Smart Lock Ultra" if "Ultra" in self._smartlock_name else "Smart Lock",
-            sw_version=None,
-            via_device=None,
-        )
-    
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return additional state attributes."""
         return {
             "smartlock_id": self._smartlock_id,
             "config_key": self._config_key,
-            "last_update": self._last_update,
+            "last_update": self._last_update.isoformat() if self._last_update else None,
             "config_type": "advanced",
         }
     
-    @property 
-    def _enhanced_logging(self) -> bool:
-        """Check if enhanced logging is enabled."""
-        return self._config_entry.options.get("enable_enhanced_logging", False)
-
     async def async_update(self) -> None:
         """Update the number entity state."""
         try:
@@ -321,7 +291,7 @@ class NukiAdvancedConfigNumberBase(NumberEntity):
             
             self._attr_native_value = advanced_config.get(self._config_key, self._attr_native_min_value)
             self._attr_available = True
-            self._last_update = datetime.now().isoformat()
+            self._last_update = dt_util.utcnow()
             
             if self._enhanced_logging:
                 _LOGGER.debug("Advanced config number %s update: %s = %s", 
@@ -3,16 +3,16 @@ Nuki Smart Lock Select Platform
 Provides dropdown selections for configurable actions and settings
 """
 import logging
-from datetime import datetime
 from typing import Any, Dict, Optional
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
+from .coordinator import device_info
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -91,7 +91,9 @@ class NukiButtonActionSelect(SelectEntity):
         self._api = api
         self._smartlock_id = smartlock_id
         self._smartlock_name = smartlock_name
+        self._attr_device_info = device_info(self._smartlock_id, self._smartlock_name)
         self._config_entry = config_entry
+        self._enhanced_logging = config_entry.options.get("enable_enhanced_logging", False)
         self._action_type = action_type
         self._config_key = config_key
         
@@ -116,16 +118,6 @@ class NukiButtonActionSelect(SelectEntity):
         self._attr_available = True
         self._last_update = None
     
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, str(self._smartlock_id))},
-            name=self._smartlock_name,
-            manufacturer="Nuki",
-            model="Smart Lock Ultra" if "Ultra" in self._smartlock_name else "Smart Lock",
-        )
-    
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return additional state attributes."""
@@ -133,14 +125,9 @@ class NukiButtonActionSelect(SelectEntity):
             "smartlock_id": self._smartlock_id,
             "config_key": self._config_key,
             "action_type": self._action_type,
-            "last_update": self._last_update,
+            "last_update": self._last_update.isoformat() if self._last_update else None,
         }
     
-    @property 
-    def _enhanced_logging(self) -> bool:
-        """Check if enhanced logging is enabled."""
-        return self._config_entry.options.get("enable_enhanced_logging", False)
-
     async def async_update(self) -> None:
         """Update the select entity state."""
         try:
@@ -150,7 +137,7 @@ class NukiButtonActionSelect(SelectEntity):
             action_value = advanced_config.get(self._config_key, 0)
             self._attr_current_option = self._action_options.get(action_value, "No Action")
             self._attr_available = True
-            self._last_update = datetime.now().isoformat()
+            self._last_update = dt_util.utcnow()
             
             if self._enhanced_logging:
                 _LOGGER.debug("Button action select %s update: %s = %s", 
@@ -229,7 +216,9 @@ class NukiMotorSpeedSelect(SelectEntity):
         self._api = api
         self._smartlock_id = smartlock_id
         self._smartlock_name = smartlock_name
+        self._attr_device_info = device_info(self._smartlock_id, self._smartlock_name)
         self._config_entry = config_entry
+        self._enhanced_logging = config_entry.options.get("enable_enhanced_logging", False)
         
         # Entity properties
         self._attr_name = f"{smartlock_name} Motor Speed"
@@ -247,30 +236,15 @@ class NukiMotorSpeedSelect(SelectEntity):
         self._attr_available = True
         self._last_update = None
     
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, str(self._smartlock_id))},
-            name=self._smartlock_name,
-            manufacturer="Nuki",
-            model="Smart Lock Ultra" if "Ultra" in self._smartlock_name else "Smart Lock",
-        )
-    
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return additional state attributes."""
         return {
             "smartlock_id": self._smartlock_id,
             "config_key": "motorSpeed",
-            "last_update": self._last_update,
+            "last_update": self._last_update.isoformat() if self._last_update else None,
         }
     
-    @property 
-    def _enhanced_logging(self) -> bool:
-        """Check if enhanced logging is enabled."""
-        return self._config_entry.options.get("enable_enhanced_logging", False)
-
     async def async_update(self) -> None:
         """Update the select entity state."""
         try:
@@ -280,7 +254,7 @@ class NukiMotorSpeedSelect(SelectEntity):
             speed_value = advanced_config.get("motorSpeed", 0)
             self._attr_current_option = self._speed_options.get(speed_value, "Standard")
             self._attr_available = True
-            self._last_update = datetime.now().isoformat()
+            self._last_update = dt_util.utcnow()
             
             if self._enhanced_logging:
                 _LOGGER.debug("Motor speed select update: %s = %s", 
@@ -14,13 +14,14 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
     DEVICE_TYPE_SMARTLOCK,
 )
+from .coordinator import device_info
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,6 +35,7 @@ async def async_setup_entry(
     data = hass.data[DOMAIN][config_entry.entry_id]
     api = data["api"]
     smartlocks = data["smartlocks"]
+    capabilities = data["capabilities"]
     
     entities = []
     
@@ -119,18 +121,13 @@ async def async_setup_entry(
                 config_entry=config_entry,
             )
         )
-        # Check if keypad is paired - we'll create a binary sensor instead of percentage sensor
-        config = smartlock.get("config", {})
-        keypad_paired = config.get("keypadPaired", False) or config.get("keypad2Paired", False)
+        # Keypad and door sensor batteries are handled as binary sensors in binary_sensor platform
+        caps = capabilities[smartlock_id]
         
-        if keypad_paired and "keypadBatteryCritical" in smartlock.get("state", {}):
+        if caps["has_keypad_battery"]:
             _LOGGER.info("Keypad paired for lock %s - binary battery sensor will be created in binary_sensor platform", smartlock_name)
         
-        # Door sensor battery will also be handled as binary sensor in binary_sensor platform
-        state = smartlock.get("state", {})
-        door_state = state.get("doorState", 0)
-        
-        if door_state != 0 and "doorsensorBatteryCritical" in state:
+        if caps["has_door_sensor_battery"]:
             _LOGGER.info("Door sensor available for lock %s - binary battery sensor will be created in binary_sensor platform", smartlock_name)
     
     if entities:
@@ -153,7 +150,9 @@ class NukiBaseBatterySensor(SensorEntity):
         self._api = api
         self._smartlock_id = smartlock_id
         self._smartlock_name = smartlock_name
+        self._attr_device_info = device_info(self._smartlock_id, self._smartlock_name)
         self._config_entry = config_entry
+        self._enhanced_logging = config_entry.options.get("enable_enhanced_logging", False)
         self._sensor_type = sensor_type
         
         # Sensor attributes
@@ -168,18 +167,6 @@ class NukiBaseBatterySensor(SensorEntity):
         self._battery_critical = False
         self._last_update = None
     
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, str(self._smartlock_id))},
-            name=self._smartlock_name,
-            manufacturer="Nuki",
-            model="Smart Lock Ultra" if "Ultra" in self._smartlock_name else "Smart Lock",
-            sw_version=None,
-            via_device=None,
-        )
-    
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return additional state attributes."""
@@ -187,15 +174,10 @@ class NukiBaseBatterySensor(SensorEntity):
             "smartlock_id": self._smartlock_id,
             "sensor_type": self._sensor_type,
             "battery_critical": self._battery_critical,
-            "last_update": self._last_update,
+            "last_update": self._last_update.isoformat() if self._last_update else None,
         }
         return attrs
     
-    @property 
-    def _enhanced_logging(self) -> bool:
-        """Check if enhanced logging is enabled."""
-        return self._config_entry.options.get("enable_enhanced_logging", False)
-
     async def async_update(self) -> None:
         """Update the sensor state."""
         try:
@@ -204,7 +186,7 @@ class NukiBaseBatterySensor(SensorEntity):
             self._update_from_smartlock_data(data)
             
             self._attr_available = True
-            self._last_update = datetime.now().isoformat()
+            self._last_update = dt_util.utcnow()
             
             if self._enhanced_logging:
                 _LOGGER.debug("%s battery update: %s%% (critical: %s)", 
@@ -309,7 +291,9 @@ class NukiLastAccessTimeSensor(SensorEntity):
         self._api = api
         self._smartlock_id = smartlock_id
         self._smartlock_name = smartlock_name
+        self._attr_device_info = device_info(self._smartlock_id, self._smartlock_name)
         self._config_entry = config_entry
+        self._enhanced_logging = config_entry.options.get("enable_enhanced_logging", False)
         
         # Sensor attributes
         self._attr_device_class = SensorDeviceClass.TIMESTAMP
@@ -321,32 +305,15 @@ class NukiLastAccessTimeSensor(SensorEntity):
         self._attr_available = True
         self._last_update = None
     
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, str(self._smartlock_id))},
-            name=self._smartlock_name,
-            manufacturer="Nuki",
-            model="Smart Lock Ultra" if "Ultra" in self._smartlock_name else "Smart Lock",
-            sw_version=None,
-            via_device=None,
-        )
-    
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return additional state attributes."""
         return {
             "smartlock_id": self._smartlock_id,
             "sensor_type": "last_access_time",
-            "last_update": self._last_update,
+            "last_update": self._last_update.isoformat() if self._last_update else None,
         }
     
-    @property 
-    def _enhanced_logging(self) -> bool:
-        """Check if enhanced logging is enabled."""
-        return self._config_entry.options.get("enable_enhanced_logging", False)
-
     async def async_update(self) -> None:
         """Update the sensor state."""
         try:
@@ -361,7 +328,7 @@ class NukiLastAccessTimeSensor(SensorEntity):
                 self._attr_native_value = None
             
             self._attr_available = True
-            self._last_update = datetime.now().isoformat()
+            self._last_update = dt_util.utcnow()
             
             if self._enhanced_logging and last_access_time:
                 _LOGGER.debug("Last access time: %s", last_access_time)
@@ -430,7 +397,9 @@ class NukiLastAccessUserSensor(SensorEntity):
         self._api = api
         self._smartlock_id = smartlock_id
         self._smartlock_name = smartlock_name
+        self._attr_device_info = device_info(self._smartlock_id, self._smartlock_name)
         self._config_entry = config_entry
+        self._enhanced_logging = config_entry.options.get("enable_enhanced_logging", False)
         
         # Sensor attributes
         self._attr_name = f"{smartlock_name} Last Access User"
@@ -442,25 +411,13 @@ class NukiLastAccessUserSensor(SensorEntity):
         self._last_update = None
         self._access_method = None
     
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, str(self._smartlock_id))},
-            name=self._smartlock_name,
-            manufacturer="Nuki",
-            model="Smart Lock Ultra" if "Ultra" in self._smartlock_name else "Smart Lock",
-            sw_version=None,
-            via_device=None,
-        )
-    
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return additional state attributes."""
         attrs = {
             "smartlock_id": self._smartlock_id,
             "sensor_type": "last_access_user",
-            "last_update": self._last_update,
+            "last_update": self._last_update.isoformat() if self._last_update else None,
         }
         if self._access_method:
             attrs["access_method"] = self._access_method
@@ -469,11 +426,6 @@ class NukiLastAccessUserSensor(SensorEntity):
             attrs["access_state_text"] = self._get_state_description(self._access_state)
         return attrs
     
-    @property 
-    def _enhanced_logging(self) -> bool:
-        """Check if enhanced logging is enabled."""
-        return self._config_entry.options.get("enable_enhanced_logging", False)
-
     async def async_update(self) -> None:
         """Update the sensor state."""
         try:
@@ -491,7 +443,7 @@ class NukiLastAccessUserSensor(SensorEntity):
                 self._access_state = None
             
             self._attr_available = True
-            self._last_update = datetime.now().isoformat()
+            self._last_update = dt_util.utcnow()
             
             if self._enhanced_logging and user_info:
                 _LOGGER.debug("Last access user: %s via %s", user_info["user"], user_info["method"])
@@ -634,9 +586,7 @@ class NukiLastAccessUserSensor(SensorEntity):
                     return entry_name
             
             # Method 3: Use configured source mapping
-            source_key = f"source_{source}"
-            if source_key in fingerprint_users and fingerprint_users[source_key]:
-                configured_user = fingerprint_users[source_key]
+            if configured_user := fingerprint_users.get(f"source_{source}"):
                 if self._enhanced_logging:
                     _LOGGER.debug("Found fingerprint user via configured mapping: %s for source %s", 
                                 configured_user, source)
@@ -761,7 +711,9 @@ class NukiLastAccessMethodSensor(SensorEntity):
         self._api = api
         self._smartlock_id = smartlock_id
         self._smartlock_name = smartlock_name
+        self._attr_device_info = device_info(self._smartlock_id, self._smartlock_name)
         self._config_entry = config_entry
+        self._enhanced_logging = config_entry.options.get("enable_enhanced_logging", False)
         
         # Sensor attributes
         self._attr_name = f"{smartlock_name} Last Access Method"
@@ -773,25 +725,13 @@ class NukiLastAccessMethodSensor(SensorEntity):
         self._last_update = None
         self._user_name = None
     
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, str(self._smartlock_id))},
-            name=self._smartlock_name,
-            manufacturer="Nuki",
-            model="Smart Lock Ultra" if "Ultra" in self._smartlock_name else "Smart Lock",
-            sw_version=None,
-            via_device=None,
-        )
-    
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return additional state attributes."""
         attrs = {
             "smartlock_id": self._smartlock_id,
             "sensor_type": "last_access_method",
-            "last_update": self._last_update,
+            "last_update": self._last_update.isoformat() if self._last_update else None,
         }
         if self._user_name:
             attrs["user_name"] = self._user_name
@@ -802,11 +742,6 @@ class NukiLastAccessMethodSensor(SensorEntity):
             attrs["state_text"] = self._get_state_description(self._method_state)
         return attrs
     
-    @property 
-    def _enhanced_logging(self) -> bool:
-        """Check if enhanced logging is enabled."""
-        return self._config_entry.options.get("enable_enhanced_logging", False)
-
     async def async_update(self) -> None:
         """Update the sensor state."""
         try:
@@ -829,7 +764,7 @@ class NukiLastAccessMethodSensor(SensorEntity):
                 self._method_state = None
             
             self._attr_available = True
-            self._last_update = datetime.now().isoformat()
+            self._last_update = dt_util.utcnow()
             
             if self._enhanced_logging and method_info:
                 _LOGGER.debug("Last access method: %s by %s", method_info["method"], method_info["user"])
@@ -933,7 +868,9 @@ class NukiAutoLockTimeoutSensor(SensorEntity):
         self._api = api
         self._smartlock_id = smartlock_id
         self._smartlock_name = smartlock_name
+        self._attr_device_info = device_info(self._smartlock_id, self._smartlock_name)
         self._config_entry = config_entry
+        self._enhanced_logging = config_entry.options.get("enable_enhanced_logging", False)
         
         self._attr_name = f"{smartlock_name} Auto Lock Timeout"
         self._attr_unique_id = f"nuki_smartlock_{smartlock_id}_auto_lock_timeout"
@@ -945,16 +882,6 @@ class NukiAutoLockTimeoutSensor(SensorEntity):
         self._attr_available = True
         self._auto_lock_enabled = None
     
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, str(self._smartlock_id))},
-            name=self._smartlock_name,
-            manufacturer="Nuki",
-            model="Smart Lock Ultra" if "Ultra" in self._smartlock_name else "Smart Lock",
-        )
-    
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return additional state attributes."""
@@ -964,11 +891,6 @@ class NukiAutoLockTimeoutSensor(SensorEntity):
             "timeout_minutes": self._attr_native_value / 60 if self._attr_native_value else None,
         }
     
-    @property 
-    def _enhanced_logging(self) -> bool:
-        """Check if enhanced logging is enabled."""
-        return self._config_entry.options.get("enable_enhanced_logging", False)
-
     async def async_update(self) -> None:
         """Update the sensor state."""
         try:
@@ -1009,7 +931,9 @@ class NukiFirmwareVersionSensor(SensorEntity):
         self._api = api
         self._smartlock_id = smartlock_id
         self._smartlock_name = smartlock_name
+        self._attr_device_info = device_info(self._smartlock_id, self._smartlock_name)
         self._config_entry = config_entry
+        self._enhanced_logging = config_entry.options.get("enable_enhanced_logging", False)
         
         self._attr_name = f"{smartlock_name} Firmware Version"
         self._attr_unique_id = f"nuki_smartlock_{smartlock_id}_firmware_version"
@@ -1019,16 +943,6 @@ class NukiFirmwareVersionSensor(SensorEntity):
         self._raw_version = None
         self._hardware_version = None
     
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, str(self._smartlock_id))},
-            name=self._smartlock_name,
-            manufacturer="Nuki",
-            model="Smart Lock Ultra" if "Ultra" in self._smartlock_name else "Smart Lock",
-        )
-    
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return additional state attributes."""
@@ -1038,11 +952,6 @@ class NukiFirmwareVersionSensor(SensorEntity):
             "hardware_version": self._hardware_version,
         }
     
-    @property 
-    def _enhanced_logging(self) -> bool:
-        """Check if enhanced logging is enabled."""
-        return self._config_entry.options.get("enable_enhanced_logging", False)
-
     async def async_update(self) -> None:
         """Update the sensor state."""
         try:
@@ -1096,7 +1005,9 @@ class NukiLEDBrightnessSensor(SensorEntity):
         self._api = api
         self._smartlock_id = smartlock_id
         self._smartlock_name = smartlock_name
+        self._attr_device_info = device_info(self._smartlock_id, self._smartlock_name)
         self._config_entry = config_entry
+        self._enhanced_logging = config_entry.options.get("enable_enhanced_logging", False)
         
         self._attr_name = f"{smartlock_name} LED Brightness"
         self._attr_unique_id = f"nuki_smartlock_{smartlock_id}_led_brightness"
@@ -1106,16 +1017,6 @@ class NukiLEDBrightnessSensor(SensorEntity):
         self._attr_available = True
         self._led_enabled = None
     
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, str(self._smartlock_id))},
-            name=self._smartlock_name,
-            manufacturer="Nuki",
-            model="Smart Lock Ultra" if "Ultra" in self._smartlock_name else "Smart Lock",
-        )
-    
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return additional state attributes."""
@@ -1125,11 +1026,6 @@ class NukiLEDBrightnessSensor(SensorEntity):
             "brightness_percentage": (self._attr_native_value * 20) if self._attr_native_value else None,
         }
     
-    @property 
-    def _enhanced_logging(self) -> bool:
-        """Check if enhanced logging is enabled."""
-        return self._config_entry.options.get("enable_enhanced_logging", False)
-
     async def async_update(self) -> None:
         """Update the sensor state."""
         try:
@@ -1175,7 +1071,9 @@ class NukiLockModeSensor(SensorEntity):
         self._api = api
         self._smartlock_id = smartlock_id
         self._smartlock_name = smartlock_name
+        self._attr_device_info = device_info(self._smartlock_id, self._smartlock_name)
         self._config_entry = config_entry
+        self._enhanced_logging = config_entry.options.get("enable_enhanced_logging", False)
         
         self._attr_name = f"{smartlock_name} Lock Mode"
         self._attr_unique_id = f"nuki_smartlock_{smartlock_id}_lock_mode"
@@ -1184,16 +1082,6 @@ class NukiLockModeSensor(SensorEntity):
         self._attr_available = True
         self._raw_mode = None
     
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, str(self._smartlock_id))},
-            name=self._smartlock_name,
-            manufacturer="Nuki",
-            model="Smart Lock Ultra" if "Ultra" in self._smartlock_name else "Smart Lock",
-        )
-    
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return additional state attributes."""
@@ -1202,11 +1090,6 @@ class NukiLockModeSensor(SensorEntity):
             "raw_mode": self._raw_mode,
         }
     
-    @property 
-    def _enhanced_logging(self) -> bool:
-        """Check if enhanced logging is enabled."""
-        return self._config_entry.options.get("enable_enhanced_logging", False)
-
     async def async_update(self) -> None:
         """Update the sensor state."""
         try:
@@ -1257,7 +1140,9 @@ class NukiBatteryTypeSensor(SensorEntity):
         self._api = api
         self._smartlock_id = smartlock_id
         self._smartlock_name = smartlock_name
+        self._attr_device_info = device_info(self._smartlock_id, self._smartlock_name)
         self._config_entry = config_entry
+        self._enhanced_logging = config_entry.options.get("enable_enhanced_logging", False)
         
         self._attr_name = f"{smartlock_name} Battery Type"
         self._attr_unique_id = f"nuki_smartlock_{smartlock_id}_battery_type"
@@ -1268,16 +1153,6 @@ class NukiBatteryTypeSensor(SensorEntity):
         self._auto_detection_enabled = None
         self._last_update = None
     
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, str(self._smartlock_id))},
-            name=self._smartlock_name,
-            manufacturer="Nuki",
-            model="Smart Lock Ultra" if "Ultra" in self._smartlock_name else "Smart Lock",
-        )
-    
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return additional state attributes."""
@@ -1285,15 +1160,10 @@ class NukiBatteryTypeSensor(SensorEntity):
             "smartlock_id": self._smartlock_id,
             "raw_battery_type": self._raw_battery_type,
             "auto_detection_enabled": self._auto_detection_enabled,
-            "last_update": self._last_update,
+            "last_update": self._last_update.isoformat() if self._last_update else None,
             "note": "This is read-only for safety. Change battery type via Nuki app if needed.",
         }
     
-    @property 
-    def _enhanced_logging(self) -> bool:
-        """Check if enhanced logging is enabled."""
-        return self._config_entry.options.get("enable_enhanced_logging", False)
-
     async def async_update(self) -> None:
         """Update the sensor state."""
         try:
@@ -1322,7 +1192,7 @@ class NukiBatteryTypeSensor(SensorEntity):
                 self._attr_native_value = battery_type_name
             
             self._attr_available = True
-            self._last_update = datetime.now().isoformat()
+            self._last_update = dt_util.utcnow()
             
             if self._enhanced_logging:
                 _LOGGER.debug("Battery type sensor update: %s (raw: %s, auto: %s)", 
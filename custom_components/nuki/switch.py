@@ -2,17 +2,17 @@
 Nuki Smart Lock Switch Platform
 Provides configuration switches for controllable settings
 """
-from datetime import datetime
 import logging
 from typing import Any, Dict, Optional
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
+from .coordinator import device_info
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -152,7 +152,9 @@ class NukiConfigSwitchBase(SwitchEntity):
         self._api = api
         self._smartlock_id = smartlock_id
         self._smartlock_name = smartlock_name
+        self._attr_device_info = device_info(self._smartlock_id, self._smartlock_name)
         self._config_entry = config_entry
+        self._enhanced_logging = config_entry.options.get("enable_enhanced_logging", False)
         self._switch_type = switch_type
         self._config_key = config_key
         
@@ -163,32 +165,15 @@ class NukiConfigSwitchBase(SwitchEntity):
         self._attr_available = True
         self._last_update = None
     
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, str(self._smartlock_id))},
-            name=self._smartlock_name,
-            manufacturer="Nuki",
-            model="Smart Lock Ultra" if "Ultra" in self._smartlock_name else "Smart Lock",
-            sw_version=None,
-            via_device=None,
-        )
-    
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return additional state attributes."""
         return {
             "smartlock_id": self._smartlock_id,
             "config_key": self._config_key,
-            "last_update": self._last_update,
+            "last_update": self._last_update.isoformat() if self._last_update else None,
         }
     
-    @property 
-    def _enhanced_logging(self) -> bool:
-        """Check if enhanced logging is enabled."""
-        return self._config_entry.options.get("enable_enhanced_logging", False)
-
     async def async_update(self) -> None:
         """Update the switch state."""
         try:
@@ -198,7 +183,7 @@ class NukiConfigSwitchBase(SwitchEntity):
             
             self._attr_is_on = bool(config.get(self._config_key, False))
             self._attr_available = True
-            self._last_update = datetime.now().isoformat()
+            self._last_update = dt_util.utcnow()
             
             if self._enhanced_logging:
                 _LOGGER.debug("Config switch %s update: %s = %s", 
@@ -382,7 +367,9 @@ class NukiAdvancedConfigSwitchBase(SwitchEntity):
         self._api = api
         self._smartlock_id = smartlock_id
         self._smartlock_name = smartlock_name
+        self._attr_device_info = device_info(self._smartlock_id, self._smartlock_name)
         self._config_entry = config_entry
+        self._enhanced_logging = config_entry.options.get("enable_enhanced_logging", False)
         self._switch_type = switch_type
         self._config_key = config_key
         
@@ -393,33 +380,16 @@ class NukiAdvancedConfigSwitchBase(SwitchEntity):
         self._attr_available = True
         self._last_update = None
     
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, str(self._smartlock_id))},
-            name=self._smartlock_name,
-            manufacturer="Nuki",
-            model="Smart Lock Ultra" if "Ultra" in self._smartlock_name else "Smart Lock",
-            sw_version=None,
-            via_device=None,
-        )
-    
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return additional state attributes."""
         return {
             "smartlock_id": self._smartlock_id,
             "config_key": self._config_key,
-            "last_update": self._last_update,
+            "last_update": self._last_update.isoformat() if self._last_update else None,
             "config_type": "advanced",
         }
     
-    @property 
-    def _enhanced_logging(self) -> bool:
-        """Check if enhanced logging is enabled."""
-        return self._config_entry.options.get("enable_enhanced_logging", False)
-
     async def async_update(self) -> None:
         """Update the switch state."""
         try:
@@ -429,7 +399,7 @@ class NukiAdvancedConfigSwitchBase(SwitchEntity):
             
             self._attr_is_on = bool(advanced_config.get(self._config_key, False))
             self._attr_available = True
-            self._last_update = datetime.now().isoformat()
+            self._last_update = dt_util.utcnow()
             
             if self._enhanced_logging:
                 _LOGGER.debug("Advanced config switch %s update: %s = %s", 